@@ -1,15 +1,29 @@
 import streamlit as st
-import pandas as pd
 import json
+import copy
 import os
 from datetime import datetime, timedelta
 import hashlib
-from pathlib import Path
+import hmac
 import secrets
-import string
-import zipfile
 import io
 import shutil
+import tempfile
+import gzip
+import functools
+import contextlib
+import concurrent.futures
+import threading
+import time
+import atexit
+from types import MappingProxyType
+from collections import defaultdict
+from operator import itemgetter
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
 # Page configuration
 st.set_page_config(
@@ -51,31 +65,240 @@ def sanitize_filename(name):
 
 def generate_short_code(length=8):
     """Generate a random short code for URLs"""
-    alphabet = string.ascii_letters + string.digits
-    return ''.join(secrets.choice(alphabet) for _ in range(length))
+    # One urandom call; base64url yields 4 chars per 3 bytes
+    return secrets.token_urlsafe(length * 3 // 4 + 1)[:length]
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MB
+# Builders keyed on file signatures only ever get asked for the current version; keep a few, not one per save
+SIGNATURE_CACHE_ENTRIES = 4
+# Directory scans are keyed per directory, so keep enough for every group's folder
+DIR_SCAN_CACHE_ENTRIES = 256
+
+def save_uploaded_file(uploaded_file, file_path):
+    """Write an uploaded file to disk, kernel-side when it is backed by a real file, else in fixed-size chunks; returns bytes written"""
+    uploaded_file.seek(0)
+    try:
+        in_fd = uploaded_file.fileno()
+    except (AttributeError, OSError):
+        # In-memory uploads (Streamlit's UploadedFile is a BytesIO) have no descriptor
+        in_fd = None
+    
+    if in_fd is not None and hasattr(os, 'sendfile'):
+        size = os.fstat(in_fd).st_size
+        with open(file_path, 'wb') as f:
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(f.fileno(), in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError:
+                if offset:
+                    raise
+                # sendfile is not supported between these files; copy in user space instead
+            else:
+                if offset < size:
+                    # The source ended early; a truncated file must not be recorded as submitted
+                    raise OSError(f"short sendfile copy: {offset} of {size} bytes")
+                return offset
+    
+    if hasattr(uploaded_file, 'getbuffer'):
+        # Write slices of the upload's own buffer rather than copying each chunk out with read()
+        with uploaded_file.getbuffer() as view, open(file_path, 'wb', buffering=0) as f:
+            for start in range(0, len(view), UPLOAD_CHUNK_SIZE):
+                chunk = view[start:start + UPLOAD_CHUNK_SIZE]
+                while chunk:
+                    chunk = chunk[f.write(chunk):]
+            return len(view)
+    
+    with open(file_path, 'wb', buffering=UPLOAD_CHUNK_SIZE) as f:
+        shutil.copyfileobj(uploaded_file, f, UPLOAD_CHUNK_SIZE)
+        return f.tell()
+
+@st.cache_resource
+def _upload_writer():
+    """Thread pool for writing uploaded files, shared across reruns and sessions"""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix="upload")
+
+def save_uploaded_files(uploaded_files, file_dir):
+    """Write uploads into file_dir concurrently; returns (uploaded_file, bytes written or the error) per distinct file name"""
+    # Uploads sharing a name would write the same path concurrently; the last one wins, as a sequential loop left it
+    by_path = {os.path.join(file_dir, uploaded_file.name): uploaded_file for uploaded_file in uploaded_files}
+    futures = [
+        (uploaded_file, _upload_writer().submit(save_uploaded_file, uploaded_file, file_path))
+        for file_path, uploaded_file in by_path.items()
+    ]
+    results = []
+    for uploaded_file, future in futures:
+        try:
+            results.append((uploaded_file, future.result()))
+        except Exception as e:
+            results.append((uploaded_file, e))
+    return results
+
+@st.cache_resource(show_spinner=False)
+def upload_format_spec(allowed_formats):
+    """Get (file_uploader types, comma-separated formats) for a tuple of allowed formats, built once per tuple"""
+    file_types = tuple(fmt[1:] if fmt.startswith('.') else fmt for fmt in allowed_formats)
+    return file_types, ', '.join(allowed_formats)
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_file_upload_settings(signature):
+    """Derive project file upload limits and formats for one version of the file submission settings file"""
+    file_settings = read_data(FILE_SUBMISSION_FILE) or {}
+    allowed_formats = tuple(file_settings.get("allowed_formats", [".pdf", ".doc", ".docx"]))
+    max_size_mb = file_settings.get("max_size_mb", 10)
+    file_types, formats_text = upload_format_spec(allowed_formats)
+    return {
+        "allow_multiple": file_settings.get("allow_multiple_submissions", False),
+        "allowed_formats": allowed_formats,
+        "max_size_mb": max_size_mb,
+        "max_size_bytes": max_size_mb * 1024 * 1024,
+        "max_files": file_settings.get("max_files", 5),
+        "file_types": file_types,
+        "formats_text": formats_text,
+        "instructions": file_settings.get("instructions", "Please upload your project files in the specified formats."),
+    }
+
+def get_file_upload_settings():
+    """Get the cached project file upload settings for the current file submission settings file"""
+    return _build_file_upload_settings(_data_signature(FILE_SUBMISSION_FILE))
+
+# Uncompressed formats worth deflating in download archives; everything else (.pdf, .docx, .zip, ...) is stored as is
+COMPRESSIBLE_EXTENSIONS = ('.txt', '.csv', '.json', '.doc', '.xls', '.ppt')
+
+def build_zip(entries):
+    """Archive (file_path, arcname) pairs and return the ZIP bytes, deflating only formats that are not already compressed"""
+    import zipfile
+    # Build on disk so the archive is held in memory once, when it is handed to the download button
+    with tempfile.TemporaryFile(suffix='.zip') as tmp:
+        with zipfile.ZipFile(tmp, 'w', zipfile.ZIP_STORED, allowZip64=True) as zip_file:
+            for file_path, arcname in entries:
+                compress_type = zipfile.ZIP_DEFLATED if arcname.lower().endswith(COMPRESSIBLE_EXTENSIONS) else zipfile.ZIP_STORED
+                zip_file.write(file_path, arcname, compress_type=compress_type)
+        tmp.seek(0)
+        return tmp.read()
+
+def _read_bytes(file_path):
+    """Read a whole file as bytes"""
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+@st.cache_data(show_spinner=False, max_entries=DIR_SCAN_CACHE_ENTRIES)
+def _scan_dir_files(directory, mtime_ns):
+    """List (path, name) pairs for the files in one version of a directory"""
+    with os.scandir(directory) as entries:
+        # DirEntry answers is_file() from the directory listing, without a stat per file
+        return tuple((entry.path, entry.name) for entry in entries if entry.is_file())
+
+def list_dir_files(directory):
+    """List (path, name) pairs for the files directly in directory, rescanning only when it changes; empty if missing"""
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    return _scan_dir_files(directory, mtime_ns)
+
+def dataframe_to_csv_bytes(df):
+    """Encode a DataFrame as CSV bytes, using pyarrow's writer when it can take the frame"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        pa = None
+    
+    if pa is not None:
+        try:
+            sink = pa.BufferOutputStream()
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), sink,
+                            pacsv.WriteOptions(quoting_style="needed"))
+            return sink.getvalue().to_pybytes()
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            # Mixed-type columns (e.g. "3 (DELETED)" next to ints) go through pandas
+            pass
+    
+    buffer = io.BytesIO()
+    df.to_csv(buffer, sep=",", index=False)
+    return buffer.getvalue()
+
+def render_metric_row(metrics):
+    """Render (label, value) metrics as one row of cards in a single markdown call"""
+    cells = "".join(f"""
+        <div style="flex: 1; background-color: #111827; padding: 1rem; border-radius: 8px;">
+            <div style="font-size: 0.9rem; color: #9ca3af;">{label}</div>
+            <div style="font-size: 2rem; font-weight: 600; color: #e5e7eb;">{value}</div>
+        </div>""" for label, value in metrics)
+    st.markdown(f'<div style="display: flex; gap: 1rem; margin-bottom: 1rem;">{cells}</div>', unsafe_allow_html=True)
+
+@st.cache_resource
+def _archive_writer():
+    """Background worker for archive writes, shared across reruns and sessions"""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="archive")
+
+def _archive_failures():
+    """This session's background archive writes that failed and are not reported yet"""
+    return st.session_state.setdefault('archive_failures', [])
+
+def _write_archive(archive_record, filepath):
+    """Write a gzipped archive under a temp name and swap it in, so the archive list never shows a partial file"""
+    tmp_path = f"{filepath}.{secrets.token_hex(4)}.tmp"
+    try:
+        _write_json(archive_record, tmp_path, True, True, fsync=True)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def report_archive_errors():
+    """Show errors from this session's background archive writes that failed since the last check"""
+    failures = _archive_failures()
+    while failures:
+        filename, error = failures.pop(0)
+        st.error(f"Error archiving data to {filename}: {error}")
 
 def archive_data(data_type, data, reason=""):
-    """Archive deleted data for record keeping"""
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{data_type}_deleted_{timestamp}.json"
+    """Archive deleted data for record keeping; the file is written in the background"""
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
+    filename = f"{data_type}_deleted_{timestamp}.json.gz"
     filepath = os.path.join(ARCHIVE_DIR, filename)
     
+    # Snapshot the data now, callers go on to modify it after archiving
     archive_record = {
         "data_type": data_type,
-        "deleted_data": data,
-        "deleted_at": datetime.now().isoformat(),
+        "deleted_data": copy.deepcopy(data),
+        "deleted_at": now.isoformat(),
         "deleted_by": "admin",
         "reason": reason
     }
     
+    report_archive_errors()
+    executor, failures = _archive_writer(), _archive_failures()
+    
+    def on_done(future):
+        # Runs on the worker thread, so failures are queued for the next rerun instead of st.error
+        if future.exception() is not None:
+            failures.append((filename, future.exception()))
+    
     try:
-        with open(filepath, 'w') as f:
-            json.dump(archive_record, f, indent=4)
+        executor.submit(_write_archive, archive_record, filepath).add_done_callback(on_done)
         return filepath
     except Exception as e:
         st.error(f"Error archiving data: {e}")
         return None
 
+def parse_archive_filename(filename):
+    """Get (data type, deleted at) from a {type}_deleted_{timestamp} archive name"""
+    stem = filename.split('.', 1)[0]
+    data_type, sep, timestamp = stem.rpartition('_deleted_')
+    try:
+        deleted_at = datetime.strptime(timestamp, "%Y%m%d_%H%M%S").isoformat()
+    except ValueError:
+        deleted_at = ""
+    return (data_type if sep else "Unknown"), deleted_at
+
 def add_to_deleted_items(item_type, item_data, reason=""):
     """Add item to deleted items list for easy viewing"""
     deleted_items = load_data(DELETED_ITEMS_FILE) or []
@@ -170,15 +393,54 @@ CLASS_ASSIGNMENTS_FILE = os.path.join(DATA_DIR, "class_assignments.json")
 DELETED_ITEMS_FILE = os.path.join(DATA_DIR, "deleted_items.json")
 DEADLINES_FILE = os.path.join(DATA_DIR, "deadlines.json")
 
-# Create data directories if they don't exist
-Path(DATA_DIR).mkdir(exist_ok=True)
-Path(ARCHIVE_DIR).mkdir(parents=True, exist_ok=True)
-Path(os.path.join(DATA_DIR, "submitted_files")).mkdir(parents=True, exist_ok=True)
-Path(os.path.join(DATA_DIR, "lab_manual")).mkdir(parents=True, exist_ok=True)
-Path(os.path.join(DATA_DIR, "class_assignments")).mkdir(parents=True, exist_ok=True)
+# List stores whose new records are appended to a .jsonl journal beside the file;
+# load_data merges the journal in and the next save_data folds it back into the file
+JOURNALED_FILES = frozenset({GROUPS_FILE, LAB_MANUAL_FILE, CLASS_ASSIGNMENTS_FILE})
 
-def init_files():
-    """Initialize data files if they don't exist"""
+# Settings files admins may read by hand; everything else is written compact
+READABLE_FILES = frozenset({CONFIG_FILE, FORM_CONTENT_FILE, ADMIN_CREDENTIALS_FILE})
+
+# scrypt hash of the default admin password "password123", precomputed
+DEFAULT_ADMIN_PASSWORD_HASH = (
+    "scrypt$74850cc19f173053046d76e4e6a97142$"
+    "de82cff47d4762fe0958e463c79b9f387fdd11a50a25568e6af95dfbadeb7f1d"
+    "9bcdf2c0ecfd5f0beabd6d1ed0f79311de6bbd89e76331d669ae9e564b6b0064"
+)
+
+@st.cache_resource
+def _ensured_dirs():
+    """Directories this process has already created, shared across reruns"""
+    return set()
+
+def ensure_dir(path):
+    """Create a directory tree, skipping the mkdir for paths this process already created"""
+    ensured = _ensured_dirs()
+    if path not in ensured:
+        os.makedirs(path, exist_ok=True)
+        ensured.add(path)
+
+def remove_dir(path):
+    """Delete a directory tree and forget it and everything under it in ensure_dir's record"""
+    shutil.rmtree(path)
+    prefix = os.path.join(path, "")
+    ensured = _ensured_dirs()
+    for known in ensured.copy():
+        if known == path or known.startswith(prefix):
+            ensured.discard(known)
+
+@st.cache_resource
+def _ensure_dirs():
+    """Create data directories if they don't exist (once per process)"""
+    for path in (DATA_DIR, ARCHIVE_DIR, os.path.join(DATA_DIR, "submitted_files"),
+                 os.path.join(DATA_DIR, "lab_manual"), os.path.join(DATA_DIR, "class_assignments")):
+        ensure_dir(path)
+    return True
+
+_ensure_dirs()
+
+@st.cache_resource
+def default_file_contents():
+    """Read-only mapping of data file path to its default contents, built once per process"""
     default_config = {
         "max_members": 3,
         "next_group_number": 1,
@@ -221,7 +483,7 @@ def init_files():
     # Admin credentials (default: admin/password123)
     default_admin = {
         "username": "admin",
-        "password_hash": hashlib.sha256("password123".encode()).hexdigest()
+        "password_hash": DEFAULT_ADMIN_PASSWORD_HASH
     }
     
     # Default form content
@@ -341,72 +603,699 @@ def init_files():
         }
     }
     
-    files_to_init = [
-        (PROJECTS_FILE, []),
-        (GROUPS_FILE, []),
-        (CONFIG_FILE, default_config),
-        (ADMIN_CREDENTIALS_FILE, default_admin),
-        (FORM_CONTENT_FILE, default_form_content),
-        (SHORT_URLS_FILE, {}),
-        (FILE_SUBMISSION_FILE, default_file_submission),
-        (FILE_SUBMISSIONS_FILE, {}),
-        (HIDDEN_FIELDS_FILE, []),
-        (LAB_MANUAL_FILE, []),
-        (CLASS_ASSIGNMENTS_FILE, []),
-        (DELETED_ITEMS_FILE, []),
-        (DEADLINES_FILE, default_deadlines),
-        (os.path.join(DATA_DIR, "lab_settings.json"), default_lab_settings),
-        (os.path.join(DATA_DIR, "class_settings.json"), default_class_settings)
+    return MappingProxyType({
+        PROJECTS_FILE: [],
+        GROUPS_FILE: [],
+        CONFIG_FILE: default_config,
+        ADMIN_CREDENTIALS_FILE: default_admin,
+        FORM_CONTENT_FILE: default_form_content,
+        SHORT_URLS_FILE: {},
+        FILE_SUBMISSION_FILE: default_file_submission,
+        FILE_SUBMISSIONS_FILE: {},
+        HIDDEN_FIELDS_FILE: [],
+        LAB_MANUAL_FILE: [],
+        CLASS_ASSIGNMENTS_FILE: [],
+        DELETED_ITEMS_FILE: [],
+        DEADLINES_FILE: default_deadlines,
+        os.path.join(DATA_DIR, "lab_settings.json"): default_lab_settings,
+        os.path.join(DATA_DIR, "class_settings.json"): default_class_settings
+    })
+
+@st.cache_resource
+def init_files():
+    """Initialize data files if they don't exist (once per process)"""
+    # One directory listing instead of a stat per file; every default file lives in DATA_DIR
+    with os.scandir(DATA_DIR) as entries:
+        present = {entry.name for entry in entries}
+    missing = [
+        (file_path, default_data)
+        for file_path, default_data in default_file_contents().items()
+        if os.path.basename(file_path) not in present
     ]
+    if not missing:
+        return
     
-    for file_path, default_data in files_to_init:
-        if not os.path.exists(file_path):
-            try:
-                with open(file_path, 'w') as f:
-                    json.dump(default_data, f, indent=4)
-            except Exception as e:
-                st.error(f"Error creating {file_path}: {e}")
+    # Write the missing defaults concurrently; errors are reported back on this thread
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="init") as executor:
+        futures = {
+            executor.submit(_write_json, default_data, file_path, file_path in READABLE_FILES): file_path
+            for file_path, default_data in missing
+        }
+        for future in concurrent.futures.as_completed(futures):
+            if future.exception() is not None:
+                st.error(f"Error creating {futures[future]}: {future.exception()}")
 
 # Load and save functions
+def _json_loads(raw):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _encode_json(data, pretty=False):
+    """Encode data to JSON bytes with orjson, or return None when it is not installed"""
+    if orjson is None:
+        return None
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None)
+
+def _write_json(data, file_path, pretty=False, compress=False, payload=None, fsync=False):
+    """Write data as JSON (gzipped if compress, flushed to disk if fsync); returns the JSON bytes when orjson builds them, else None"""
+    opener = functools.partial(gzip.open, compresslevel=5) if compress else open
+    if payload is None:
+        payload = _encode_json(data, pretty)
+    if payload is not None:
+        with opener(file_path, 'wb') as f:
+            f.write(payload)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        return payload
+    
+    # Without orjson, stream the stdlib encoder straight into the file buffer
+    with opener(file_path, 'wt' if compress else 'w', encoding='utf-8') as f:
+        if pretty:
+            json.dump(data, f, indent=2)
+        else:
+            json.dump(data, f, separators=(',', ':'))
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    return None
+
+def _fsync_dir(path):
+    """Flush a directory's entries to disk so completed renames in it survive a crash"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # Windows cannot open directories; its renames are not fsync-able this way
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+@st.cache_resource
+def _file_cache():
+    """Process-wide {path: (signature, data, content digest)} cache shared by all sessions"""
+    return {}
+
+@st.cache_resource
+def _journal_lock():
+    """Lock serializing journal appends with the save_data that folds the journal away"""
+    return threading.Lock()
+
+def _journal_path(file_path):
+    """Return the append-only journal path for a journaled list file"""
+    return f"{os.path.splitext(file_path)[0]}.jsonl"
+
+def _read_journal(file_path):
+    """Read the records appended to a journaled file; returns (records, bytes read up to the last complete line)"""
+    try:
+        with open(_journal_path(file_path), 'rb') as f:
+            raw = f.read()
+    except FileNotFoundError:
+        return [], 0
+    end = raw.rfind(b"\n") + 1
+    records = []
+    for line in raw[:end].splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(_json_loads(line))
+        except ValueError:
+            # A fragment left by a crash mid-append; the next append starts a fresh line after it
+            continue
+    return records, end
+
+def _loaded_journal_positions():
+    """{path: (main file (mtime_ns, size), journal bytes merged)} for journaled files this session last loaded to edit"""
+    return st.session_state.setdefault('journal_positions', {})
+
+def _journal_tail(file_path, position):
+    """Read the journal bytes appended after position, all of them if it was started after that load (call under the journal lock)"""
+    try:
+        with open(_journal_path(file_path), 'rb') as f:
+            stat = os.stat(file_path)
+            # Every save replaces the main file and restarts the journal, so a changed main file means a newer journal
+            if position and position[0] == (stat.st_mtime_ns, stat.st_size):
+                f.seek(position[1])
+            return f.read()
+    except FileNotFoundError:
+        return b""
+
+def _replace_journal(file_path, tail):
+    """Restart the journal with tail, or remove it when there is nothing to carry (call under the journal lock)"""
+    journal_path = _journal_path(file_path)
+    if not tail:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(journal_path)
+        return
+    tmp_path = f"{journal_path}.{secrets.token_hex(4)}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(tail)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, journal_path)
+
+def _file_signature(file_path, stat=None):
+    """Return a (mtime_ns, size) pair identifying the current file contents, plus the journal's for journaled files;
+    stat may be given for a temp file about to be renamed over file_path, since the rename keeps its mtime and size"""
+    if stat is None:
+        stat = os.stat(file_path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    if file_path in JOURNALED_FILES:
+        with contextlib.suppress(FileNotFoundError):
+            journal = os.stat(_journal_path(file_path))
+            signature += (journal.st_mtime_ns, journal.st_size)
+    return signature
+
+def _load_cached(file_path):
+    """Return the process-wide (signature, data, digest, journal position) entry for file_path, re-reading it only when the file changed"""
+    if not os.path.exists(file_path):
+        return None
+    cache = _file_cache()
+    signature = _file_signature(file_path)
+    cached = cache.get(file_path)
+    if cached is None or cached[0] != signature:
+        with open(file_path, 'rb') as f:
+            data = _json_loads(f.read())
+        journal_position = None
+        if file_path in JOURNALED_FILES and isinstance(data, list):
+            records, journal_end = _read_journal(file_path)
+            data.extend(records)
+            # Journal offsets only mean something for the main file version they were appended to
+            journal_position = (signature[:2], journal_end)
+        cached = (signature, data, None, journal_position)
+        cache[file_path] = cached
+    return cached
+
 def load_data(file_path):
     """Load data from JSON file"""
     try:
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as f:
-                return json.load(f)
+        cached = _load_cached(file_path)
+        if cached is None:
+            return None
+        if cached[3] is not None:
+            # Remember how much of the journal this copy holds, so saving it keeps later appends
+            _loaded_journal_positions()[file_path] = cached[3]
+        # Callers mutate the result before saving, so hand out a copy
+        return copy.deepcopy(cached[1])
+    except (FileNotFoundError, json.JSONDecodeError) as e:
+        st.error(f"Error loading {file_path}: {e}")
         return None
+
+def read_data(file_path):
+    """Load data from JSON file for read-only use; the cached object is shared, so never mutate it"""
+    try:
+        cached = _load_cached(file_path)
+        return cached[1] if cached is not None else None
     except (FileNotFoundError, json.JSONDecodeError) as e:
         st.error(f"Error loading {file_path}: {e}")
         return None
 
-def save_data(data, file_path):
-    """Save data to JSON file"""
+def save_data(data, file_path, pretty=False, sync_dir=True):
+    """Save data to JSON file (indented for files admins may read by hand); sync_dir=False leaves the directory fsync to the caller"""
+    try:
+        payload = _encode_json(data, pretty)
+        digest = hashlib.blake2b(payload, digest_size=16).digest() if payload is not None else None
+        
+        # Skip the write if this process last wrote the same bytes and the file is unchanged since
+        cached = _file_cache().get(file_path)
+        if (digest is not None and cached is not None and cached[2] == digest
+                and _data_signature(file_path) == cached[0]):
+            return True
+        
+        # Write to a temp file and swap it in so readers never see a partial file;
+        # the name is unique so concurrent sessions saving the same file don't share it
+        tmp_path = f"{file_path}.{secrets.token_hex(4)}.tmp"
+        try:
+            payload = _write_json(data, tmp_path, pretty, payload=payload, fsync=True)
+            # Stat the temp file before the swap: stat-ing file_path afterwards could pick up
+            # another session's save and pair it with this data in the cache
+            tmp_stat = os.stat(tmp_path)
+            carried = []
+            journal_position = None
+            if file_path in JOURNALED_FILES:
+                with _journal_lock():
+                    # data holds the journal up to where it was loaded; records appended after that
+                    # are carried into a fresh journal instead of being deleted with the old one
+                    tail = _journal_tail(file_path, _loaded_journal_positions().get(file_path) or (cached and cached[3]))
+                    os.replace(tmp_path, file_path)
+                    _replace_journal(file_path, tail)
+                    carried, journal_end = _read_journal(file_path)
+                    signature = _file_signature(file_path, tmp_stat)
+                journal_position = (signature[:2], journal_end)
+                # The saved data holds none of the new journal; a further save of it must keep all of it
+                _loaded_journal_positions()[file_path] = (signature[:2], 0)
+            else:
+                signature = _file_signature(file_path, tmp_stat)
+                os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if sync_dir:
+            _fsync_dir(os.path.dirname(file_path) or ".")
+        if payload is not None:
+            saved = _json_loads(payload)
+            if carried:
+                saved.extend(carried)
+            _file_cache()[file_path] = (signature, saved, digest, journal_position)
+        else:
+            _file_cache().pop(file_path, None)
+        return True
+    except Exception as e:
+        st.error(f"Error saving to {file_path}: {e}")
+        return False
+
+def append_record(record, file_path):
+    """Append one record to a journaled list file without rewriting the file"""
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=4)
+        line = _encode_json(record)
+        if line is None:
+            line = json.dumps(record, separators=(',', ':')).encode('utf-8')
+        with _journal_lock():
+            with open(_journal_path(file_path), 'a+b') as f:
+                # A crash mid-append leaves a fragment without its newline; start this record on its own line
+                end = f.seek(0, os.SEEK_END)
+                if end:
+                    f.seek(end - 1)
+                    if f.read(1) != b"\n":
+                        line = b"\n" + line
+                f.write(line + b"\n")
+        _file_cache().pop(file_path, None)
         return True
     except Exception as e:
         st.error(f"Error saving to {file_path}: {e}")
         return False
 
+def patch_data(file_path, updates, pretty=False):
+    """Merge updates into a JSON object file, skipping the write if nothing changes"""
+    data = load_data(file_path) or {}
+    if all(key in data and data[key] == value for key, value in updates.items()):
+        return True
+    data.update(updates)
+    return save_data(data, file_path, pretty)
+
+class SaveBatch:
+    """Data staged for saving; each file is written once when the batch closes"""
+    
+    def __init__(self):
+        self.staged = {}
+        self.saved = False
+    
+    def stage(self, data, file_path, pretty=False):
+        """Stage data for file_path, replacing anything staged earlier for it"""
+        self.staged[file_path] = (data, pretty)
+    
+    def patch(self, file_path, updates, pretty=False):
+        """Stage updates merged into a JSON object file, as patch_data does; unchanged files are not staged"""
+        data = self.staged[file_path][0] if file_path in self.staged else (load_data(file_path) or {})
+        if all(key in data and data[key] == value for key, value in updates.items()):
+            return
+        data.update(updates)
+        self.stage(data, file_path, pretty)
+
+@contextlib.contextmanager
+def batched_saves():
+    """Collect related saves and write each staged file once on exit, with one directory fsync for all of them"""
+    batch = SaveBatch()
+    yield batch
+    results = [save_data(data, file_path, pretty, sync_dir=False) for file_path, (data, pretty) in batch.staged.items()]
+    try:
+        for directory in {os.path.dirname(file_path) or "." for file_path in batch.staged}:
+            _fsync_dir(directory)
+    except OSError as e:
+        st.error(f"Error syncing saved data: {e}")
+        results.append(False)
+    batch.saved = all(results)
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_group_indices(signature):
+    """Build lookup indices over active groups for one version of the groups file"""
+    groups = read_data(GROUPS_FILE) or []
+    active_groups = [g for g in groups if not g.get('deleted', False)]
+    return {
+        "by_number": {g['group_number']: g for g in active_groups},
+        "roll_set": {
+            m['roll_no'].strip()
+            for g in active_groups
+            for m in g['members']
+            if m['roll_no'].strip()
+        },
+        "selected_projects": {g['project_name'] for g in active_groups if g.get('project_name')},
+        "leader_by_number": {g['group_number']: get_group_leader(g) for g in active_groups},
+    }
+
+def get_group_leader(group):
+    """Get the group leader's name, scanning members for records without leader_name"""
+    if 'leader_name' in group:
+        return group['leader_name']
+    return next((m.get('name', '') for m in group.get('members', []) if m.get('is_leader')), "")
+
+def count_members(members):
+    """Count members with a non-blank name"""
+    return sum(1 for m in members if m['name'].strip())
+
+def get_member_count(group):
+    """Get the number of named members, counting them for records without member_count"""
+    if 'member_count' in group:
+        return group['member_count']
+    return count_members(group['members'])
+
+def _data_signature(file_path):
+    """Return the file signature, or None if the file does not exist yet"""
+    return _file_signature(file_path) if os.path.exists(file_path) else None
+
+def get_group_indices():
+    """Get cached group indices for the current groups file"""
+    return _build_group_indices(_data_signature(GROUPS_FILE))
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_lab_manual_rolls(signature):
+    """Collect roll numbers with a lab manual submission for one version of the lab manual file"""
+    return {s.get('roll_no') for s in read_data(LAB_MANUAL_FILE) or []}
+
+def get_lab_manual_rolls():
+    """Get cached lab manual roll numbers for the current lab manual file"""
+    return _build_lab_manual_rolls(_data_signature(LAB_MANUAL_FILE))
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_class_assignment_keys(signature):
+    """Collect (roll number, assignment number) pairs for one version of the class assignments file"""
+    return {(s.get('roll_no'), s.get('assignment_no')) for s in read_data(CLASS_ASSIGNMENTS_FILE) or []}
+
+def get_class_assignment_keys():
+    """Get cached class assignment submission keys for the current class assignments file"""
+    return _build_class_assignment_keys(_data_signature(CLASS_ASSIGNMENTS_FILE))
+
+def active_records(records):
+    """Get the records not marked deleted"""
+    # Same dicts as records, so callers can edit them and save records
+    return [r for r in records if not r.get('deleted', False)]
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_allocations_summary(groups_signature, projects_signature):
+    """Build the student allocations table for one version of the groups and projects files"""
+    import pandas as pd
+    
+    groups = read_data(GROUPS_FILE) or []
+    projects = read_data(PROJECTS_FILE) or []
+    active_groups = [g for g in groups if not g.get('deleted', False)]
+    
+    df = pd.DataFrame(active_groups).reindex(columns=['group_number', 'project_name', 'members', 'leader_name', 'member_count'])
+    df['project_name'] = df['project_name'].fillna('').replace('', "No project selected")
+    
+    # First matching active project wins, as in the old lookup loop
+    project_status = {}
+    for project in reversed(projects):
+        if not project.get('deleted', False):
+            project_status[project['name']] = project.get('status', 'Not Selected')
+    
+    # One row per member, indexed by the owning group's row
+    members = df['members'].explode().dropna()
+    members = pd.DataFrame(members.tolist(), index=members.index).reindex(columns=['name', 'is_leader'])
+    names = members['name'].fillna('').astype(str)
+    leaders = names[members['is_leader'].eq(True)].groupby(level=0).first()
+    member_counts = names.str.strip().ne('').groupby(level=0).sum()
+    
+    summary = pd.DataFrame({
+        "Group #": df['group_number'],
+        "Project Name": df['project_name'],
+        "Project Status": df['project_name'].map(project_status).fillna("Not Selected"),
+        "Group Leader": df['leader_name'].fillna(leaders.reindex(df.index, fill_value="")),
+        "Members": df['member_count'].fillna(member_counts.reindex(df.index, fill_value=0)).astype(int),
+    })
+    return summary.sort_values("Group #", kind="stable").reset_index(drop=True)
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _compute_available_projects(groups_signature, projects_signature):
+    """List projects still open for selection for one version of the groups and projects files"""
+    projects = read_data(PROJECTS_FILE) or []
+    selected_projects = _build_group_indices(groups_signature)["selected_projects"]
+    return [
+        p for p in projects
+        if not p.get('deleted', False)
+        and p.get('status') == 'Not Selected'
+        and p['name'] not in selected_projects
+    ]
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_project_positions(projects_signature):
+    """Map each project name to its first list position for one version of the projects file"""
+    positions = {}
+    for i, project in enumerate(read_data(PROJECTS_FILE) or []):
+        positions.setdefault(project['name'], i)
+    return positions
+
+def find_project(projects, name):
+    """Find the first project named name in a list just loaded from the projects file, deleted or not"""
+    position = _build_project_positions(_data_signature(PROJECTS_FILE)).get(name)
+    if position is not None and position < len(projects) and projects[position]['name'] == name:
+        return projects[position]
+    # The file changed since projects were loaded; scan them directly
+    return next((p for p in projects if p['name'] == name), None)
+
+def get_available_projects():
+    """Get cached available projects for the current groups and projects files"""
+    return _compute_available_projects(_data_signature(GROUPS_FILE), _data_signature(PROJECTS_FILE))
+
+def get_project_options():
+    """Get available projects keyed by name in list order, kept in session state until groups or projects change"""
+    version = (_data_signature(GROUPS_FILE), _data_signature(PROJECTS_FILE))
+    cached = st.session_state.get('project_options')
+    if cached is None or cached['version'] != version:
+        cached = {
+            "version": version,
+            "by_name": {p['name']: p for p in get_available_projects()}
+        }
+        st.session_state.project_options = cached
+    return cached['by_name']
+
+def get_allocations_summary():
+    """Get the cached allocations table for the current groups and projects files"""
+    return _build_allocations_summary(_data_signature(GROUPS_FILE), _data_signature(PROJECTS_FILE))
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_group_overview(groups_signature):
+    """Build the group management table for one version of the groups file"""
+    import pandas as pd
+    
+    groups = read_data(GROUPS_FILE) or []
+    
+    # Fill one list per column rather than one dict per row
+    numbers, projects, leaders, statuses, member_counts, submitted = [], [], [], [], [], []
+    row_fields = itemgetter('group_number', 'project_name', 'status')
+    for group in groups:
+        if group.get('deleted', False):
+            continue
+        number, project_name, status = row_fields(group)
+        numbers.append(number)
+        projects.append(project_name if project_name else "No project selected")
+        leaders.append(get_group_leader(group))
+        statuses.append(status)
+        member_counts.append(get_member_count(group))
+        submitted.append(group.get('submission_date', ''))
+    return pd.DataFrame({
+        "Group #": numbers,
+        "Project": projects,
+        "Group Leader": leaders,
+        "Status": statuses,
+        "Members": member_counts,
+        "Submitted": submitted
+    })
+
+def get_group_overview():
+    """Get the cached group management table for the current groups file"""
+    return _build_group_overview(_data_signature(GROUPS_FILE))
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_file_submission_status(groups_signature, submissions_signature):
+    """Build the project file submission status table for one version of the groups and file submissions files"""
+    import pandas as pd
+    
+    groups = read_data(GROUPS_FILE) or []
+    file_submissions = read_data(FILE_SUBMISSIONS_FILE) or {}
+    active_groups = [g for g in groups if not g.get('deleted', False)]
+    
+    # One list per column in a single pass over groups sorted by number
+    leader_by_number = _build_group_indices(groups_signature)["leader_by_number"]
+    numbers, projects, leaders, file_counts, statuses, last_submissions, multiple = [], [], [], [], [], [], []
+    for group in sorted(active_groups, key=itemgetter('group_number')):
+        group_num = group['group_number']
+        group_files = file_submissions.get(str(group_num), [])
+        
+        # Get last submission time
+        last_submission = "Not submitted"
+        if group_files:
+            submission_times = [f.get('uploaded_at', '') for f in group_files if f.get('uploaded_at')]
+            if submission_times:
+                try:
+                    last_time = max(submission_times)
+                    last_submission = datetime.fromisoformat(last_time).strftime("%Y-%m-%d %H:%M")
+                except:
+                    last_submission = "Unknown"
+        
+        numbers.append(group_num)
+        projects.append(group['project_name'] if group['project_name'] else "No project selected")
+        leaders.append(leader_by_number.get(group_num) or get_group_leader(group))
+        file_counts.append(len(group_files))
+        statuses.append("✅ Submitted" if group_files else "❌ Not Submitted")
+        last_submissions.append(last_submission)
+        multiple.append("Yes" if any(f.get('submission_count', 0) > 1 for f in group_files) else "No")
+    
+    return pd.DataFrame({
+        "Group #": numbers,
+        "Project": projects,
+        "Group Leader": leaders,
+        "Files Submitted": file_counts,
+        "Status": statuses,
+        "Last Submission": last_submissions,
+        "Multiple Submissions": multiple
+    })
+
+def get_file_submission_status():
+    """Get the cached file submission status table for the current groups and file submissions files"""
+    return _build_file_submission_status(_data_signature(GROUPS_FILE), _data_signature(FILE_SUBMISSIONS_FILE))
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_lab_manual_table(lab_signature):
+    """Build the lab manual submissions table for one version of the lab manual file"""
+    import pandas as pd
+    
+    lab_manual = read_data(LAB_MANUAL_FILE) or []
+    df_data = []
+    for submission in lab_manual:
+        df_data.append({
+            "Name": submission.get('name', ''),
+            "Roll No": submission.get('roll_no', ''),
+            "Subject": submission.get('subject_name', ''),
+            "Status": submission.get('status', 'Submitted'),
+            "Files": len(submission.get('files', [])),
+            "File Size": f"{sum(f.get('file_size', 0) for f in submission.get('files', [])) / 1024:.1f} KB" if submission.get('files') else "N/A",
+            "Submitted": datetime.fromisoformat(submission.get('submission_date', '')).strftime('%Y-%m-%d %H:%M'),
+            "Uploaded By": submission.get('uploaded_by', 'Student')
+        })
+    return pd.DataFrame(df_data)
+
+def get_lab_manual_table():
+    """Get the cached lab manual submissions table for the current lab manual file"""
+    return _build_lab_manual_table(_data_signature(LAB_MANUAL_FILE))
+
+@st.cache_data(show_spinner=False, max_entries=SIGNATURE_CACHE_ENTRIES)
+def _build_class_assignments_table(class_signature):
+    """Build the class assignment submissions table for one version of the class assignments file"""
+    import pandas as pd
+    
+    class_assignments = read_data(CLASS_ASSIGNMENTS_FILE) or []
+    df_data = []
+    for submission in class_assignments:
+        df_data.append({
+            "Name": submission.get('name', ''),
+            "Roll No": submission.get('roll_no', ''),
+            "Course": submission.get('course_name', ''),
+            "Assignment No": submission.get('assignment_no', 1),
+            "Files": len(submission.get('files', [])),
+            "File Size": f"{sum(f.get('file_size', 0) for f in submission.get('files', [])) / 1024:.1f} KB" if submission.get('files') else "N/A",
+            "Submitted": datetime.fromisoformat(submission.get('submission_date', '')).strftime('%Y-%m-%d %H:%M'),
+            "Uploaded By": submission.get('uploaded_by', 'Student')
+        })
+    return pd.DataFrame(df_data)
+
+def get_class_assignments_table():
+    """Get the cached class assignment submissions table for the current class assignments file"""
+    return _build_class_assignments_table(_data_signature(CLASS_ASSIGNMENTS_FILE))
+
+_sha256 = hashlib.sha256
+
+# scrypt cost settings for admin passwords (about 16 MB of memory per hash)
+SCRYPT_PARAMS = {"n": 2 ** 14, "r": 8, "p": 1}
+
 def hash_password(password):
-    """Hash password for secure storage"""
-    return hashlib.sha256(password.encode()).hexdigest()
+    """Hash password for secure storage as a salted scrypt key"""
+    salt = secrets.token_bytes(16)
+    key = hashlib.scrypt(password.encode('utf-8'), salt=salt, **SCRYPT_PARAMS)
+    return f"scrypt${salt.hex()}${key.hex()}"
+
+def needs_rehash(password_hash):
+    """Check whether a stored hash predates scrypt (a bare unsalted SHA-256 hex digest)"""
+    return not password_hash.startswith("scrypt$")
+
+def verify_password(password, password_hash):
+    """Check a password against a stored scrypt or legacy SHA-256 hash in constant time"""
+    if not password_hash:
+        return False
+    if needs_rehash(password_hash):
+        return hmac.compare_digest(_sha256(password.encode('utf-8')).hexdigest().encode(), password_hash.encode())
+    try:
+        _, salt_hex, key_hex = password_hash.split('$')
+        salt, expected = bytes.fromhex(salt_hex), bytes.fromhex(key_hex)
+    except ValueError:
+        return False
+    return hmac.compare_digest(hashlib.scrypt(password.encode('utf-8'), salt=salt, **SCRYPT_PARAMS), expected)
 
 # Authentication
 def authenticate(username, password):
-    """Authenticate admin user"""
+    """Authenticate admin user, upgrading a legacy password hash after a successful login"""
     admin_data = load_data(ADMIN_CREDENTIALS_FILE)
     if not admin_data:
         return False
     
-    password_hash = hash_password(password)
-    return admin_data.get("username") == username and admin_data.get("password_hash") == password_hash
+    # Only hash the password once the username matches
+    if admin_data.get("username") != username or not verify_password(password, admin_data.get("password_hash")):
+        return False
+    if needs_rehash(admin_data["password_hash"]):
+        admin_data["password_hash"] = hash_password(password)
+        save_data(admin_data, ADMIN_CREDENTIALS_FILE, pretty=True)
+    return True
 
 def get_base_url():
-    """Get base URL from config"""
-    config = load_data(CONFIG_FILE) or {}
-    return config.get('base_url', 'http://localhost:8501')
+    """Get base URL from config, kept in session state until the config file changes"""
+    version = _data_signature(CONFIG_FILE)
+    cached = st.session_state.get('base_url_cache')
+    if cached is None or cached['version'] != version:
+        config = load_data(CONFIG_FILE) or {}
+        cached = {"version": version, "base_url": config.get('base_url', 'http://localhost:8501')}
+        st.session_state.base_url_cache = cached
+    return cached['base_url']
+
+CLICK_FLUSH_INTERVAL = 10  # seconds
+CLICK_FLUSH_BATCH = 50  # clicks
+
+@st.cache_resource
+def _click_buffer():
+    """Short URL clicks not yet written to disk, shared by all sessions"""
+    buffer = {"lock": threading.Lock(), "pending": {}, "count": 0, "last_flush": time.monotonic()}
+    atexit.register(flush_short_url_clicks)
+    return buffer
+
+def flush_short_url_clicks():
+    """Write buffered short URL clicks to the short URLs file in one save"""
+    buffer = _click_buffer()
+    with buffer["lock"]:
+        pending = buffer["pending"]
+        buffer["pending"], buffer["count"], buffer["last_flush"] = {}, 0, time.monotonic()
+        if not pending:
+            return True
+        
+        short_urls = load_data(SHORT_URLS_FILE) or {}
+        for short_code, (clicks, last_accessed) in pending.items():
+            # Codes deleted since the click are dropped
+            if short_code in short_urls:
+                short_urls[short_code]['clicks'] = short_urls[short_code].get('clicks', 0) + clicks
+                short_urls[short_code]['last_accessed'] = last_accessed
+        return save_data(short_urls, SHORT_URLS_FILE)
+
+def record_short_url_click(short_code):
+    """Count a short URL click in memory, flushing every CLICK_FLUSH_BATCH clicks or CLICK_FLUSH_INTERVAL seconds"""
+    buffer = _click_buffer()
+    with buffer["lock"]:
+        entry = buffer["pending"].setdefault(short_code, [0, None])
+        entry[0] += 1
+        entry[1] = datetime.now().isoformat()
+        buffer["count"] += 1
+        due = (buffer["count"] >= CLICK_FLUSH_BATCH
+               or time.monotonic() - buffer["last_flush"] >= CLICK_FLUSH_INTERVAL)
+    if due:
+        flush_short_url_clicks()
 
 # Initialize files
 init_files()
@@ -899,17 +1788,13 @@ st.markdown("""
 # STUDENT FORM FUNCTIONS - MAIN CONTENT AREA
 # ============================================
 
-def display_cover_page(form_content):
-    """Display the cover page"""
-    cover = form_content.get("cover_page", {})
-    if not cover.get("enabled", True):
-        return
-    
-    # Apply custom styles with enhanced UI
-    st.markdown(f"""
+@st.cache_data(show_spinner=False)
+def _cover_page_html(title, background_color, text_color):
+    """Build the cover page card HTML, once per cover page settings"""
+    return f"""
     <div class="card" style="
-        background: linear-gradient(135deg, {cover.get('background_color', '#1f2937')} 0%, #111827 100%);
-        color: {cover.get('text_color', '#e5e7eb')};
+        background: linear-gradient(135deg, {background_color} 0%, #111827 100%);
+        color: {text_color};
         padding: 2.5rem;
         border-radius: 16px;
         margin-bottom: 2rem;
@@ -917,31 +1802,39 @@ def display_cover_page(form_content):
         box-shadow: 0 10px 25px rgba(0, 0, 0, 0.3);
     ">
         <div style="font-size: 2.8rem; font-weight: 800; margin-bottom: 1.5rem; background: linear-gradient(90deg, #4f46e5, #7c3aed); -webkit-background-clip: text; -webkit-text-fill-color: transparent;">
-            {cover.get('title', '🎓 Project Allocation')}
+            {title}
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    st.markdown("<hr style='border: 2px solid #374151; border-radius: 5px; margin: 2rem 0;'>", unsafe_allow_html=True)
+    """
 
-def display_form_header(form_content):
-    """Display the form header/title section"""
-    header = form_content.get("form_header", {})
-    
-    st.markdown(f'<h1 class="main-header">{header.get("title", "Project Selection Form")}</h1>', unsafe_allow_html=True)
+def display_cover_page(form_content):
+    """Display the cover page"""
+    cover = form_content.get("cover_page", {})
+    if not cover.get("enabled", True):
+        return
     
-    # Description in a card
-    st.markdown(f"""
+    # Apply custom styles with enhanced UI
+    st.markdown(_cover_page_html(
+        cover.get('title', '🎓 Project Allocation'),
+        cover.get('background_color', '#1f2937'),
+        cover.get('text_color', '#e5e7eb')
+    ), unsafe_allow_html=True)
+    st.markdown("<hr style='border: 2px solid #374151; border-radius: 5px; margin: 2rem 0;'>", unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def _form_header_html(title, description, contact_email):
+    """Build the (title, description, contact) HTML blocks, once per form header settings; contact is None when hidden"""
+    title_html = f'<h1 class="main-header">{title}</h1>'
+    description_html = f"""
     <div class="info-card">
         <div style="font-size: 1.1rem; line-height: 1.6;">
-            {header.get('description', 'Please fill in all required fields to submit your project group allocation. All fields marked with * are mandatory.')}
+            {description}
         </div>
     </div>
-    """, unsafe_allow_html=True)
-    
-    # Contact info only if enabled
-    if header.get("show_contact", True):
-        contact_email = header.get("contact_email", "coal@university.edu")
-        st.markdown(f"""
+    """
+    if contact_email is None:
+        return title_html, description_html, None
+    contact_html = f"""
         <div style="background-color: #1e3a8a; padding: 1rem 1.5rem; border-radius: 10px; border-left: 4px solid #3b82f6; margin: 1rem 0;">
             <div style="display: flex; align-items: center; gap: 10px;">
                 <span style="font-size: 1.2rem;">📧</span>
@@ -951,11 +1844,31 @@ def display_form_header(form_content):
                 </div>
             </div>
         </div>
-        """, unsafe_allow_html=True)
+        """
+    return title_html, description_html, contact_html
+
+def display_form_header(form_content):
+    """Display the form header/title section"""
+    header = form_content.get("form_header", {})
+    
+    title_html, description_html, contact_html = _form_header_html(
+        header.get("title", "Project Selection Form"),
+        header.get('description', 'Please fill in all required fields to submit your project group allocation. All fields marked with * are mandatory.'),
+        # Contact info only if enabled
+        header.get("contact_email", "coal@university.edu") if header.get("show_contact", True) else None
+    )
+    
+    st.markdown(title_html, unsafe_allow_html=True)
+    
+    # Description in a card
+    st.markdown(description_html, unsafe_allow_html=True)
+    
+    if contact_html is not None:
+        st.markdown(contact_html, unsafe_allow_html=True)
     
     st.markdown("<hr style='border: 2px solid #374151; border-radius: 5px; margin: 2rem 0;'>", unsafe_allow_html=True)
 
-def class_assignment_submission_form():
+def class_assignment_submission_form(config):
     """Form for class assignment submission - MAIN CONTENT AREA - REMARKS REMOVED"""
     st.markdown('<h2 class="sub-header">📘 Class Assignment Submission</h2>', unsafe_allow_html=True)
     
@@ -982,8 +1895,7 @@ def class_assignment_submission_form():
         </div>
         """, unsafe_allow_html=True)
     
-    # Load course name from config
-    config = load_data(CONFIG_FILE) or {}
+    # Course name from config
     course_name = config.get("course_name", "")
     current_assignment_no = config.get("current_assignment_no", 1)
     
@@ -1025,19 +1937,14 @@ def class_assignment_submission_form():
         # File upload in a card
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin-bottom: 1rem;">📎 Upload Assignment File</h3>', unsafe_allow_html=True)
         
-        # Convert formats for file_uploader
-        file_types = []
-        for fmt in allowed_formats:
-            if fmt.startswith('.'):
-                file_types.append(fmt[1:])
-            else:
-                file_types.append(fmt)
+        # Formats for file_uploader, converted once per allowed-format list
+        file_types, formats_text = upload_format_spec(tuple(allowed_formats))
         
         uploaded_files = st.file_uploader(
             f"**Upload your assignment file(s)***",
             type=file_types,
             accept_multiple_files=True,
-            help=f"📁 Allowed formats: {', '.join(allowed_formats)} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB"
+            help=f"📁 Allowed formats: {formats_text} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB"
         )
         
         # Check file count and size
@@ -1095,24 +2002,24 @@ def class_assignment_submission_form():
                 for error in errors:
                     st.markdown(f'<div class="error-card">{error}</div>', unsafe_allow_html=True)
             else:
-                # Load existing submissions
-                class_submissions = load_data(CLASS_ASSIGNMENTS_FILE) or []
-                
                 # Sanitize roll number for directory name
                 sanitized_roll_no = sanitize_filename(roll_no.strip())
                 
                 # Check if this roll number already submitted this assignment
-                existing = next((s for s in class_submissions if s.get('roll_no') == roll_no.strip() and s.get('assignment_no') == assignment_no), None)
-                if existing:
+                if (roll_no.strip(), assignment_no) in get_class_assignment_keys():
                     st.error("❌ This roll number has already submitted this assignment")
                 else:
+                    # One clock read for the record, file names and confirmation
+                    now = datetime.now()
+                    file_timestamp = now.strftime("%Y%m%d_%H%M%S")
+                    
                     # Create submission record
                     submission_record = {
                         "name": name.strip(),
                         "roll_no": roll_no.strip(),
                         "course_name": course_name,
                         "assignment_no": assignment_no,
-                        "submission_date": datetime.now().isoformat(),
+                        "submission_date": now.isoformat(),
                         "status": "Submitted",
                         "files": []
                     }
@@ -1121,22 +2028,20 @@ def class_assignment_submission_form():
                     if uploaded_files:
                         # Create directory for class assignments
                         class_dir = os.path.join(DATA_DIR, "class_assignments")
-                        Path(class_dir).mkdir(parents=True, exist_ok=True)
+                        ensure_dir(class_dir)
                         
                         # Create directory for this submission using sanitized roll number
                         submission_dir = os.path.join(class_dir, f"{sanitized_roll_no}_assignment_{assignment_no}")
-                        Path(submission_dir).mkdir(parents=True, exist_ok=True)
+                        ensure_dir(submission_dir)
                         
                         for uploaded_file in uploaded_files:
                             # Generate unique filename with sanitized names
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                             sanitized_filename = sanitize_filename(uploaded_file.name)
-                            filename = f"{timestamp}_{sanitized_roll_no}_{assignment_no}_{sanitized_filename}"
+                            filename = f"{file_timestamp}_{sanitized_roll_no}_{assignment_no}_{sanitized_filename}"
                             file_path = os.path.join(submission_dir, filename)
                             
                             # Save file
-                            with open(file_path, 'wb') as f:
-                                f.write(uploaded_file.getbuffer())
+                            save_uploaded_file(uploaded_file, file_path)
                             
                             submission_record["files"].append({
                                 "filename": filename,
@@ -1146,8 +2051,7 @@ def class_assignment_submission_form():
                             })
                     
                     # Save to database
-                    class_submissions.append(submission_record)
-                    save_data(class_submissions, CLASS_ASSIGNMENTS_FILE)
+                    append_record(submission_record, CLASS_ASSIGNMENTS_FILE)
                     
                     # Success message with animation
                     st.markdown("""
@@ -1188,7 +2092,7 @@ def class_assignment_submission_form():
                         </div>
                         <div style="background-color: #065f46; padding: 1rem; border-radius: 8px;">
                             <div style="font-size: 0.9rem; color: #a7f3d0;">Submission Time</div>
-                            <div style="font-weight: 600;">{datetime.now().strftime("%Y-%m-%d %H:%M")}</div>
+                            <div style="font-weight: 600;">{now.strftime("%Y-%m-%d %H:%M")}</div>
                         </div>
                     </div>
                     
@@ -1202,7 +2106,7 @@ def class_assignment_submission_form():
                     
                     st.markdown('</div>', unsafe_allow_html=True)
 
-def lab_manual_submission_form():
+def lab_manual_submission_form(config):
     """Form for lab manual submission - MAIN CONTENT AREA"""
     st.markdown('<h2 class="sub-header">📚 Lab Manual Submission</h2>', unsafe_allow_html=True)
     
@@ -1229,8 +2133,7 @@ def lab_manual_submission_form():
         </div>
         """, unsafe_allow_html=True)
     
-    # Load subject name from config
-    config = load_data(CONFIG_FILE) or {}
+    # Subject name from config
     lab_subject_name = config.get("lab_subject_name", "")
     
     # Subject name display
@@ -1266,19 +2169,14 @@ def lab_manual_submission_form():
         # File upload in a card
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin-bottom: 1rem;">📎 Upload File</h3>', unsafe_allow_html=True)
         
-        # Convert formats for file_uploader
-        file_types = []
-        for fmt in allowed_formats:
-            if fmt.startswith('.'):
-                file_types.append(fmt[1:])
-            else:
-                file_types.append(fmt)
+        # Formats for file_uploader, converted once per allowed-format list
+        file_types, formats_text = upload_format_spec(tuple(allowed_formats))
         
         uploaded_files = st.file_uploader(
             f"**Upload your file(s)**{'*' if file_required else ''}",
             type=file_types,
             accept_multiple_files=True,
-            help=f"📁 Allowed formats: {', '.join(allowed_formats)} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB"
+            help=f"📁 Allowed formats: {formats_text} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB"
         )
         
         # Check file count and size
@@ -1336,20 +2234,20 @@ def lab_manual_submission_form():
                 for error in errors:
                     st.markdown(f'<div class="error-card">{error}</div>', unsafe_allow_html=True)
             else:
-                # Load existing submissions
-                lab_manual = load_data(LAB_MANUAL_FILE) or []
-                
                 # Check if roll number already submitted
-                existing = next((s for s in lab_manual if s.get('roll_no') == roll_no.strip()), None)
-                if existing:
+                if roll_no.strip() in get_lab_manual_rolls():
                     st.error("❌ This roll number has already submitted a lab manual")
                 else:
+                    # One clock read for the record and file names
+                    now = datetime.now()
+                    file_timestamp = now.strftime("%Y%m%d_%H%M%S")
+                    
                     # Create submission record
                     submission_record = {
                         "name": name.strip(),
                         "roll_no": roll_no.strip(),
                         "subject_name": lab_subject_name,
-                        "submission_date": datetime.now().isoformat(),
+                        "submission_date": now.isoformat(),
                         "status": "Submitted",
                         "files": []
                     }
@@ -1358,25 +2256,23 @@ def lab_manual_submission_form():
                     if uploaded_files:
                         # Create directory for lab manual
                         lab_dir = os.path.join(DATA_DIR, "lab_manual")
-                        Path(lab_dir).mkdir(parents=True, exist_ok=True)
+                        ensure_dir(lab_dir)
                         
                         # Sanitize roll number for directory name
                         sanitized_roll_no = sanitize_filename(roll_no.strip())
                         
                         # Create directory for this submission
                         submission_dir = os.path.join(lab_dir, sanitized_roll_no)
-                        Path(submission_dir).mkdir(parents=True, exist_ok=True)
+                        ensure_dir(submission_dir)
                         
                         for uploaded_file in uploaded_files:
                             # Generate unique filename with sanitized names
-                            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                             sanitized_filename = sanitize_filename(uploaded_file.name)
-                            filename = f"{timestamp}_{sanitized_roll_no}_{sanitized_filename}"
+                            filename = f"{file_timestamp}_{sanitized_roll_no}_{sanitized_filename}"
                             file_path = os.path.join(submission_dir, filename)
                             
                             # Save file
-                            with open(file_path, 'wb') as f:
-                                f.write(uploaded_file.getbuffer())
+                            save_uploaded_file(uploaded_file, file_path)
                             
                             submission_record["files"].append({
                                 "filename": filename,
@@ -1385,8 +2281,7 @@ def lab_manual_submission_form():
                             })
                     
                     # Save to database
-                    lab_manual.append(submission_record)
-                    save_data(lab_manual, LAB_MANUAL_FILE)
+                    append_record(submission_record, LAB_MANUAL_FILE)
                     
                     # Success message
                     st.markdown("""
@@ -1433,9 +2328,8 @@ def lab_manual_submission_form():
                     
                     st.markdown('</div>', unsafe_allow_html=True)
 
-def display_instructions(form_content):
+def display_instructions(form_content, config):
     """Display instructions tab based on current mode - MAIN CONTENT AREA"""
-    config = load_data(CONFIG_FILE) or {}
     current_mode = config.get("form_mode", "project_allocation")
     
     instructions = form_content.get("instructions", {})
@@ -1474,9 +2368,59 @@ def display_instructions(form_content):
     </div>
     """, unsafe_allow_html=True)
 
+def _project_allocation_tabs(config, form_content, tab_visibility):
+    """Tabs for MODE A: Project Allocation Mode"""
+    allow_edit = config.get("allow_allocation_edit", False)
+    tabs = []
+    if allow_edit and tab_visibility.get("form", True):
+        tabs.append(("📋 **Project Selection Form**", lambda: display_submission_form(form_content, config)))
+    if tab_visibility.get("allocations", True):
+        tabs.append(("📊 **View Allocations**", display_allocations_table_for_students))
+    if tab_visibility.get("instructions", True):
+        tabs.append(("ℹ️ **Instructions**", lambda: display_instructions(form_content, config)))
+    return tabs
+
+def _project_file_submission_tabs(config, form_content, tab_visibility):
+    """Tabs for MODE B: Project File Submission Mode"""
+    submission_open = config.get("project_file_submission_open", False)
+    tabs = []
+    if submission_open and tab_visibility.get("form", True):
+        tabs.append(("📁 **Submit Files**", lambda: display_project_file_submission_form(form_content, config)))
+    if tab_visibility.get("allocations", True):
+        tabs.append(("📊 **View Allocations**", display_allocations_table_for_students))
+    if tab_visibility.get("instructions", True):
+        tabs.append(("ℹ️ **Instructions**", lambda: display_instructions(form_content, config)))
+    return tabs
+
+def _lab_manual_tabs(config, form_content, tab_visibility):
+    """Tabs for MODE C: Lab Manual Submission Mode"""
+    tabs = []
+    if tab_visibility.get("form", True):
+        tabs.append(("📚 **Lab Manual Submission**", lambda: lab_manual_submission_form(config)))
+    if tab_visibility.get("instructions", True):
+        tabs.append(("ℹ️ **Instructions**", lambda: display_instructions(form_content, config)))
+    return tabs
+
+def _class_assignment_tabs(config, form_content, tab_visibility):
+    """Tabs for MODE D: Class Assignment Submission Mode"""
+    tabs = []
+    if tab_visibility.get("form", True):
+        tabs.append(("📘 **Class Assignment Submission**", lambda: class_assignment_submission_form(config)))
+    if tab_visibility.get("instructions", True):
+        tabs.append(("ℹ️ **Instructions**", lambda: display_instructions(form_content, config)))
+    return tabs
+
+# Form mode -> builder of that mode's (label, render function) tabs; the mode is also its deadline key
+STUDENT_FORM_TABS = {
+    "project_allocation": _project_allocation_tabs,
+    "project_file_submission": _project_file_submission_tabs,
+    "lab_manual": _lab_manual_tabs,
+    "class_assignment": _class_assignment_tabs,
+}
+
 def student_form_standalone():
     """Student form without Admin Dashboard option in sidebar"""
-    # Load config
+    # Load config once; every tab below reads this copy
     config = load_data(CONFIG_FILE) or {}
     
     # Check if form is published
@@ -1496,182 +2440,48 @@ def student_form_standalone():
     
     # Determine which mode is active
     form_mode = config.get("form_mode", "project_allocation")
+    build_tabs = STUDENT_FORM_TABS.get(form_mode)
+    if build_tabs is None:
+        return
     form_content = load_data(FORM_CONTENT_FILE) or {}
     
     # Get tab visibility settings
     tab_visibility = config.get("tab_visibility", {}).get(form_mode, {})
+    tabs = build_tabs(config, form_content, tab_visibility)
     
-    if form_mode == "project_allocation":
-        # MODE A: Project Allocation Mode
-        allow_edit = config.get("allow_allocation_edit", False)
-        status = get_form_status("project_allocation")
-        
-        # Build tabs list based on visibility and allow_edit
-        tabs = []
-        if allow_edit and tab_visibility.get("form", True):
-            tabs.append(("📋 **Project Selection Form**", lambda: display_submission_form(form_content, config)))
-        if tab_visibility.get("allocations", True):
-            tabs.append(("📊 **View Allocations**", display_allocations_table_for_students))
-        if tab_visibility.get("instructions", True):
-            tabs.append(("ℹ️ **Instructions**", lambda: display_instructions(form_content)))
-        
-        # If no tabs enabled, show a message
-        if not tabs:
-            st.warning("⚠️ No tabs are enabled for this mode. Please contact administrator.")
-            return
-        
-        # Show deadline status before tabs
-        if not status["open"]:
-            st.markdown(f"""
-            <div class="error-card">
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <span style="font-size: 1.5rem;">⛔</span>
-                    <div style="font-size: 1.1rem; font-weight: 600;">{status['message']}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            return
-        
-        if status["message"]:
-            st.markdown(f"""
-            <div class="info-card">
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <span style="font-size: 1.2rem;">⏰</span>
-                    <div>{status['message']}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        # Create tabs
-        tab_objects = st.tabs([label for label, _ in tabs])
-        for i, (_, func) in enumerate(tabs):
-            with tab_objects[i]:
-                func()
-    
-    elif form_mode == "project_file_submission":
-        # MODE B: Project File Submission Mode
-        submission_open = config.get("project_file_submission_open", False)
-        status = get_form_status("project_file_submission")
-        
-        # Build tabs
-        tabs = []
-        if submission_open and tab_visibility.get("form", True):
-            tabs.append(("📁 **Submit Files**", lambda: display_project_file_submission_form(form_content, config)))
-        if tab_visibility.get("allocations", True):
-            tabs.append(("📊 **View Allocations**", display_allocations_table_for_students))
-        if tab_visibility.get("instructions", True):
-            tabs.append(("ℹ️ **Instructions**", lambda: display_instructions(form_content)))
-        
-        if not tabs:
-            st.warning("⚠️ No tabs are enabled for this mode. Please contact administrator.")
-            return
-        
-        # Show deadline status
-        if not status["open"]:
-            st.markdown(f"""
-            <div class="error-card">
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <span style="font-size: 1.5rem;">⛔</span>
-                    <div style="font-size: 1.1rem; font-weight: 600;">{status['message']}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            return
-        
-        if status["message"]:
-            st.markdown(f"""
-            <div class="info-card">
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <span style="font-size: 1.2rem;">⏰</span>
-                    <div>{status['message']}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        tab_objects = st.tabs([label for label, _ in tabs])
-        for i, (_, func) in enumerate(tabs):
-            with tab_objects[i]:
-                func()
-    
-    elif form_mode == "lab_manual":
-        # MODE C: Lab Manual Submission Mode
-        status = get_form_status("lab_manual")
-        
-        tabs = []
-        if tab_visibility.get("form", True):
-            tabs.append(("📚 **Lab Manual Submission**", lab_manual_submission_form))
-        if tab_visibility.get("instructions", True):
-            tabs.append(("ℹ️ **Instructions**", lambda: display_instructions(form_content)))
-        
-        if not tabs:
-            st.warning("⚠️ No tabs are enabled for this mode. Please contact administrator.")
-            return
-        
-        if not status["open"]:
-            st.markdown(f"""
-            <div class="error-card">
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <span style="font-size: 1.5rem;">⛔</span>
-                    <div style="font-size: 1.1rem; font-weight: 600;">{status['message']}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-            return
-        
-        if status["message"]:
-            st.markdown(f"""
-            <div class="info-card">
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <span style="font-size: 1.2rem;">⏰</span>
-                    <div>{status['message']}</div>
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        tab_objects = st.tabs([label for label, _ in tabs])
-        for i, (_, func) in enumerate(tabs):
-            with tab_objects[i]:
-                func()
-    
-    elif form_mode == "class_assignment":
-        # MODE D: Class Assignment Submission Mode
-        status = get_form_status("class_assignment")
-        
-        tabs = []
-        if tab_visibility.get("form", True):
-            tabs.append(("📘 **Class Assignment Submission**", class_assignment_submission_form))
-        if tab_visibility.get("instructions", True):
-            tabs.append(("ℹ️ **Instructions**", lambda: display_instructions(form_content)))
-        
-        if not tabs:
-            st.warning("⚠️ No tabs are enabled for this mode. Please contact administrator.")
-            return
-        
-        if not status["open"]:
-            st.markdown(f"""
-            <div class="error-card">
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <span style="font-size: 1.5rem;">⛔</span>
-                    <div style="font-size: 1.1rem; font-weight: 600;">{status['message']}</div>
-                </div>
+    # If no tabs enabled, show a message
+    if not tabs:
+        st.warning("⚠️ No tabs are enabled for this mode. Please contact administrator.")
+        return
+    
+    # Show deadline status before tabs
+    status = get_form_status(form_mode)
+    if not status["open"]:
+        st.markdown(f"""
+        <div class="error-card">
+            <div style="display: flex; align-items: center; gap: 10px;">
+                <span style="font-size: 1.5rem;">⛔</span>
+                <div style="font-size: 1.1rem; font-weight: 600;">{status['message']}</div>
             </div>
-            """, unsafe_allow_html=True)
-            return
-        
-        if status["message"]:
-            st.markdown(f"""
-            <div class="info-card">
-                <div style="display: flex; align-items: center; gap: 10px;">
-                    <span style="font-size: 1.2rem;">⏰</span>
-                    <div>{status['message']}</div>
-                </div>
+        </div>
+        """, unsafe_allow_html=True)
+        return
+    
+    if status["message"]:
+        st.markdown(f"""
+        <div class="info-card">
+            <div style="display: flex; align-items: center; gap: 10px;">
+                <span style="font-size: 1.2rem;">⏰</span>
+                <div>{status['message']}</div>
             </div>
-            """, unsafe_allow_html=True)
-        
-        tab_objects = st.tabs([label for label, _ in tabs])
-        for i, (_, func) in enumerate(tabs):
-            with tab_objects[i]:
-                func()
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Create tabs
+    tab_objects = st.tabs([label for label, _ in tabs])
+    for i, (_, func) in enumerate(tabs):
+        with tab_objects[i]:
+            func()
 
 def display_project_file_submission_form(form_content, config):
     """Display project file submission form with submission status - MAIN CONTENT AREA"""
@@ -1732,10 +2542,10 @@ def display_project_file_submission_form(form_content, config):
         
         if verify_clicked:
             # Verify group exists
-            groups = load_data(GROUPS_FILE) or []
-            group_exists = any(g['group_number'] == group_number and not g.get('deleted', False) for g in groups)
+            group_indices = get_group_indices()
+            group = group_indices["by_number"].get(group_number)
             
-            if not group_exists:
+            if group is None:
                 st.error("❌ Group number not found. Please check your group number.")
                 st.info("You must have submitted a project allocation first.")
                 st.session_state.project_files_data['group_verified'] = False
@@ -1744,23 +2554,12 @@ def display_project_file_submission_form(form_content, config):
                 st.session_state.project_files_data['group_number'] = group_number
                 
                 # Get group details
-                group = next((g for g in groups if g['group_number'] == group_number), None)
                 if group:
                     st.session_state.project_files_data['project_name'] = group.get('project_name', 'N/A')
-                    leader_name = ""
-                    for member in group.get('members', []):
-                        if member.get('is_leader'):
-                            leader_name = member.get('name', '')
-                            break
-                    st.session_state.project_files_data['leader_name'] = leader_name
-                
-                # Check if group has already submitted files
-                file_submissions = load_data(FILE_SUBMISSIONS_FILE) or {}
-                group_files = file_submissions.get(str(group_number), [])
-                st.session_state.project_files_data['has_submitted'] = len(group_files) > 0
+                    st.session_state.project_files_data['leader_name'] = group_indices["leader_by_number"][group_number]
                 
+                # The upload section below renders in this same run, no rerun needed
                 st.success(f"✅ Group {group_number} verified!")
-                st.rerun()
         st.markdown('</div>', unsafe_allow_html=True)
         
         # If group is verified, show details and file upload
@@ -1768,7 +2567,13 @@ def display_project_file_submission_form(form_content, config):
             group_number = st.session_state.project_files_data['group_number']
             project_name = st.session_state.project_files_data['project_name']
             leader_name = st.session_state.project_files_data['leader_name']
-            has_submitted = st.session_state.project_files_data['has_submitted']
+            
+            # Load submissions and settings once for the status, upload and submit sections
+            file_submissions = load_data(FILE_SUBMISSIONS_FILE) or {}
+            group_files = file_submissions.get(str(group_number), [])
+            has_submitted = bool(group_files)
+            upload_settings = get_file_upload_settings()
+            allow_multiple = upload_settings["allow_multiple"]
             
             # Show group details in a card
             st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin-bottom: 1rem;">📋 Group Details</h3>', unsafe_allow_html=True)
@@ -1792,9 +2597,6 @@ def display_project_file_submission_form(form_content, config):
             # Display submission status in a card
             st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin-bottom: 1rem;">📊 Submission Status</h3>', unsafe_allow_html=True)
             
-            file_submissions = load_data(FILE_SUBMISSIONS_FILE) or {}
-            group_files = file_submissions.get(str(group_number), [])
-            
             if group_files:
                 status_icon = "✅"
                 status_text = "Submitted"
@@ -1810,10 +2612,6 @@ def display_project_file_submission_form(form_content, config):
                 </div>
                 """, unsafe_allow_html=True)
                 
-                # Check if multiple submissions are allowed
-                file_settings = load_data(FILE_SUBMISSION_FILE) or {}
-                allow_multiple = file_settings.get("allow_multiple_submissions", False)
-                
                 if not allow_multiple:
                     st.warning("⚠️ **Note:** Multiple submissions are not allowed. You have already submitted your files.")
             else:
@@ -1835,23 +2633,11 @@ def display_project_file_submission_form(form_content, config):
             # File upload section in a card
             st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin-bottom: 1rem;">📎 Upload Files</h3>', unsafe_allow_html=True)
             
-            # Load file submission settings
-            file_settings = load_data(FILE_SUBMISSION_FILE) or {}
-            allowed_formats = file_settings.get("allowed_formats", [".pdf", ".doc", ".docx"])
-            max_size_mb = file_settings.get("max_size_mb", 10)
-            max_files = file_settings.get("max_files", 5)
-            max_size_bytes = max_size_mb * 1024 * 1024
-            
-            # Convert formats for file_uploader
-            file_types = []
-            for fmt in allowed_formats:
-                if fmt.startswith('.'):
-                    file_types.append(fmt[1:])
-                else:
-                    file_types.append(fmt)
-            
-            # Check if multiple submissions are allowed
-            allow_multiple = file_settings.get("allow_multiple_submissions", False)
+            # File submission limits and uploader formats, derived once per settings file version
+            max_size_mb = upload_settings["max_size_mb"]
+            max_files = upload_settings["max_files"]
+            max_size_bytes = upload_settings["max_size_bytes"]
+            file_types, formats_text = upload_settings["file_types"], upload_settings["formats_text"]
             
             # If already submitted and multiple submissions not allowed, disable upload
             if has_submitted and not allow_multiple:
@@ -1862,7 +2648,7 @@ def display_project_file_submission_form(form_content, config):
                     f"**Upload your project files***",
                     type=file_types,
                     accept_multiple_files=True,
-                    help=f"📁 Allowed formats: {', '.join(allowed_formats)} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB per file",
+                    help=f"📁 Allowed formats: {formats_text} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB per file",
                     key="project_file_uploader_main"
                 )
             
@@ -1871,7 +2657,7 @@ def display_project_file_submission_form(form_content, config):
             <div style="background-color: #0c4a6e; padding: 1rem; border-radius: 8px; margin-top: 1rem;">
                 <div style="display: flex; align-items: center; gap: 10px;">
                     <span style="font-size: 1.2rem;">ℹ️</span>
-                    <div>{file_settings.get("instructions", "Please upload your project files in the specified formats.")}</div>
+                    <div>{upload_settings["instructions"]}</div>
                 </div>
             </div>
             """, unsafe_allow_html=True)
@@ -1905,37 +2691,33 @@ def display_project_file_submission_form(form_content, config):
                     else:
                         # Store files in session state temporarily
                         st.session_state.project_files_data['uploaded_files'] = uploaded_files
+                        uploaded_at = datetime.now().isoformat()
                         
                         # Save to database
-                        if str(group_number) not in file_submissions:
-                            file_submissions[str(group_number)] = []
+                        group_entries = file_submissions.setdefault(str(group_number), [])
+                        new_entries = []
+                        file_dir = os.path.join(DATA_DIR, "submitted_files", str(group_number))
+                        ensure_dir(file_dir)
                         
-                        for uploaded_file in uploaded_files:
-                            file_info = {
+                        # Save all files to disk at once; the recorded size is what actually landed there
+                        for uploaded_file, size in save_uploaded_files(uploaded_files, file_dir):
+                            if isinstance(size, Exception):
+                                st.error(f"Error saving file {uploaded_file.name}: {size}")
+                                continue
+                            
+                            new_entries.append({
                                 "filename": uploaded_file.name,
-                                "size": uploaded_file.size,
-                                "uploaded_at": datetime.now().isoformat(),
+                                "size": size,
+                                "uploaded_at": uploaded_at,
                                 "project_name": project_name,
                                 "group_leader": leader_name,
-                                "submission_count": len(file_submissions[str(group_number)]) + 1
-                            }
-                            file_submissions[str(group_number)].append(file_info)
-                            
-                            # Save file to disk
-                            file_dir = os.path.join(DATA_DIR, "submitted_files", str(group_number))
-                            Path(file_dir).mkdir(parents=True, exist_ok=True)
-                            file_path = os.path.join(file_dir, uploaded_file.name)
-                            try:
-                                with open(file_path, 'wb') as f:
-                                    f.write(uploaded_file.getbuffer())
-                            except Exception as e:
-                                st.error(f"Error saving file {uploaded_file.name}: {e}")
-                                continue
+                                "submission_count": len(group_entries) + len(new_entries) + 1
+                            })
                         
+                        group_entries.extend(new_entries)
                         save_data(file_submissions, FILE_SUBMISSIONS_FILE)
                         
                         # Update session state
-                        st.session_state.project_files_data['has_submitted'] = True
                         st.session_state.project_files_data['uploaded_files'] = []
                         
                         st.success("✅ Files submitted successfully!")
@@ -1948,14 +2730,14 @@ def display_allocations_table_for_students():
     st.markdown('<h2 class="sub-header">📊 Current Project Allocations</h2>', unsafe_allow_html=True)
     
     # Load data
-    groups = load_data(GROUPS_FILE) or []
-    projects = load_data(PROJECTS_FILE) or []
+    groups = read_data(GROUPS_FILE) or []
+    projects = read_data(PROJECTS_FILE) or []
     
     # Filter out deleted groups
-    active_groups = [g for g in groups if not g.get('deleted', False)]
+    active_groups = active_records(groups)
     
     # Filter active projects (not deleted)
-    active_projects = [p for p in projects if not p.get('deleted', False)]
+    active_projects = active_records(projects)
     
     if not active_groups:
         st.markdown("""
@@ -1971,36 +2753,7 @@ def display_allocations_table_for_students():
         """, unsafe_allow_html=True)
     else:
         # Create enhanced DataFrame with Project Status
-        summary_data = []
-        for group in sorted(active_groups, key=lambda x: x.get('group_number', 0)):
-            # Find group leader
-            group_leader = ""
-            for member in group.get('members', []):
-                if member.get('is_leader'):
-                    group_leader = member.get('name', '')
-                    break
-            
-            # Get project name (could be empty if optional)
-            project_name = group.get('project_name', '')
-            if not project_name:
-                project_name = "No project selected"
-            
-            # Get project status
-            project_status = "Not Selected"
-            for project in active_projects:
-                if project['name'] == project_name:
-                    project_status = project.get('status', 'Not Selected')
-                    break
-            
-            summary_data.append({
-                "Group #": group.get('group_number', ''),
-                "Project Name": project_name,
-                "Project Status": project_status,
-                "Group Leader": group_leader,
-                "Members": len([m for m in group.get('members', []) if m.get('name', '').strip()])
-            })
-        
-        df_summary = pd.DataFrame(summary_data)
+        df_summary = get_allocations_summary()
         
         # Display table with enhanced styling
         st.markdown('<div class="card">', unsafe_allow_html=True)
@@ -2024,33 +2777,18 @@ def display_allocations_table_for_students():
     # Show project statistics with enhanced information
     st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📈 Project Statistics</h3>', unsafe_allow_html=True)
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Groups", len(active_groups), delta=None, delta_color="normal")
-    
-    with col2:
-        # Count groups with submitted projects (status is 'Submitted')
-        submitted_groups = len([g for g in active_groups if g.get('status') == 'Submitted'])
-        st.metric("Submitted Groups", submitted_groups, delta=None, delta_color="normal")
+    # Count groups with submitted projects (status is 'Submitted')
+    submitted_groups = sum(1 for g in active_groups if g.get('status') == 'Submitted')
     
-    with col3:
-        st.metric("Total Projects", len(active_projects), delta=None, delta_color="normal")
+    # Get available projects (Not Selected status and not already selected)
+    available_projects = get_available_projects()
     
-    with col4:
-        # Calculate available projects (not selected by any group)
-        selected_projects = set()
-        for group in active_groups:
-            if group.get('project_name'):
-                selected_projects.add(group['project_name'])
-        
-        # Get available projects (Not Selected status and not already selected)
-        available_projects = []
-        for project in active_projects:
-            if project.get('status') == 'Not Selected' and project['name'] not in selected_projects:
-                available_projects.append(project)
-        
-        st.metric("Available Projects", len(available_projects), delta=None, delta_color="normal")
+    render_metric_row([
+        ("Total Groups", len(active_groups)),
+        ("Submitted Groups", submitted_groups),
+        ("Total Projects", len(active_projects)),
+        ("Available Projects", len(available_projects)),
+    ])
     
     st.markdown('</div>', unsafe_allow_html=True)
     
@@ -2147,14 +2885,16 @@ def display_submission_form(form_content, config):
     project_optional = config.get("project_allocation_project_optional", False)
     
     # Load projects
-    projects = load_data(PROJECTS_FILE) or []
+    projects = read_data(PROJECTS_FILE) or []
     
     if not projects:
         st.warning("No projects available yet. Please contact administrator.")
         return
     
+    # Projects not deleted, not selected and not taken by a group; shared by the count, the selectbox and validation
+    available_projects = get_project_options()
+    
     # Show available projects count BEFORE form
-    available_projects = [p for p in projects if p.get('status') == 'Not Selected' and not p.get('deleted', False)]
     st.markdown(f"""
     <div class="info-card">
         <div style="display: flex; align-items: center; gap: 10px;">
@@ -2219,11 +2959,8 @@ def display_submission_form(form_content, config):
         else:
             st.markdown("*Select ONE project from the available options below*")
         
-        # Get only unselected projects that are not deleted
-        available_projects = [p for p in projects if p.get('status') == 'Not Selected' and not p.get('deleted', False)]
-        project_options = [f"{p['name']}" for p in available_projects]
-        
-        if not project_options:
+        # Available projects (computed above the form)
+        if not available_projects:
             if project_optional:
                 st.info("No projects currently available – you may submit without a project.")
                 project_choice = None
@@ -2232,58 +2969,34 @@ def display_submission_form(form_content, config):
                 st.info("Please contact the administrator for more options.")
                 project_choice = None
         else:
-            # Check for duplicate roll numbers in submissions
-            groups = load_data(GROUPS_FILE) or []
-            
-            # Filter out projects already selected
-            selected_projects = set()
-            for group in groups:
-                if group.get('project_name') and not group.get('deleted', False):
-                    selected_projects.add(group['project_name'])
+            project_options_final = list(available_projects)
+            if project_optional:
+                # Add a blank option to allow no selection
+                project_options_final.insert(0, "")
             
-            # Only show projects not already selected and not deleted
-            final_available_projects = [
-                p for p in available_projects 
-                if p['name'] not in selected_projects 
-                and not p.get('deleted', False)
-            ]
+            project_choice = st.selectbox(
+                "**Select Your Project**" + ("" if project_optional else "*"),
+                options=project_options_final,
+                help="Choose only one project from the available options" + (" (optional)" if project_optional else ""),
+                format_func=lambda x: "No project selected" if x == "" else x
+            )
             
-            if not final_available_projects:
-                if project_optional:
-                    st.info("No projects currently available – you may submit without a project.")
-                    project_choice = None
-                else:
-                    st.error("❌ All available projects have already been selected by other groups.")
-                    project_choice = None
-            else:
-                project_options_final = [f"{p['name']}" for p in final_available_projects]
-                if project_optional:
-                    # Add a blank option to allow no selection
-                    project_options_final.insert(0, "")
-                
-                project_choice = st.selectbox(
-                    "**Select Your Project**" + ("" if project_optional else "*"),
-                    options=project_options_final,
-                    help="Choose only one project from the available options" + (" (optional)" if project_optional else ""),
-                    format_func=lambda x: "No project selected" if x == "" else x
-                )
-                
-                # Show project count
-                st.markdown(f"""
-                <div style="background-color: #0c4a6e; padding: 0.75rem; border-radius: 8px; margin: 1rem 0;">
-                    <div style="display: flex; align-items: center; gap: 10px;">
-                        <span style="font-size: 1.1rem;">📊</span>
-                        <div>{len(project_options_final) - (1 if project_optional else 0)} project(s) available for selection</div>
-                    </div>
+            # Show project count
+            st.markdown(f"""
+            <div style="background-color: #0c4a6e; padding: 0.75rem; border-radius: 8px; margin: 1rem 0;">
+                <div style="display: flex; align-items: center; gap: 10px;">
+                    <span style="font-size: 1.1rem;">📊</span>
+                    <div>{len(available_projects)} project(s) available for selection</div>
                 </div>
-                """, unsafe_allow_html=True)
-                
-                # Show available projects list with status
-                if project_options_final:
-                    with st.expander("📋 **View Available Projects with Status**", expanded=False):
-                        for project in final_available_projects:
-                            status_icon = "✅" if project.get('status') == 'Submitted' else "⏳"
-                            st.markdown(f"{status_icon} **{project['name']}** - Status: {project.get('status', 'Not Selected')}")
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Show available projects list with status
+            if project_options_final:
+                with st.expander("📋 **View Available Projects with Status**", expanded=False):
+                    for project in available_projects.values():
+                        status_icon = "✅" if project.get('status') == 'Submitted' else "⏳"
+                        st.markdown(f"{status_icon} **{project['name']}** - Status: {project.get('status', 'Not Selected')}")
         st.markdown('</div>', unsafe_allow_html=True)
         
         # Terms and conditions in a card
@@ -2306,6 +3019,9 @@ def display_submission_form(form_content, config):
             )
         
         if submitted:
+            # Load current projects once for validation and saving; the new group is appended
+            projects_data = load_data(PROJECTS_FILE) or []
+            
             # Validation
             errors = []
             
@@ -2323,50 +3039,24 @@ def display_submission_form(form_content, config):
             if not agree_final:
                 errors.append("❌ Please confirm that selection is final")
             
-            # Check for duplicate roll numbers within this submission
-            roll_numbers = [m['roll_no'] for m in members_data if m['roll_no'].strip()]
-            unique_rolls = [r for r in roll_numbers if r.strip()]
-            if len(unique_rolls) != len(set(unique_rolls)):
-                errors.append("❌ Duplicate roll numbers detected within your group")
-            
-            # Check if roll numbers already used in other submissions
-            groups = load_data(GROUPS_FILE) or []
-            existing_rolls = set()
-            for group in groups:
-                if not group.get('deleted', False):
-                    for member in group['members']:
-                        if member['roll_no'].strip():
-                            existing_rolls.add(member['roll_no'].strip())
+            # Check roll numbers for duplicates within this submission and in other submissions
+            rolls = [m['roll_no'].strip() for m in members_data if m['roll_no'].strip()]
+            submitted_rolls = set(rolls)
+            registered_rolls = submitted_rolls & get_group_indices()["roll_set"]
             
-            duplicate_existing = False
-            for roll in unique_rolls:
-                if roll.strip() in existing_rolls:
-                    duplicate_existing = True
-                    errors.append(f"❌ Roll number {roll} is already registered in another group")
-                    break
+            if len(submitted_rolls) < len(rolls):
+                errors.append("❌ Duplicate roll numbers detected within your group")
+            if registered_rolls:
+                errors.append(f"❌ Roll number(s) {', '.join(sorted(registered_rolls))} already registered in another group")
             
             # Check if project is still available (only if a project was chosen)
-            if project_choice:
-                projects_data = load_data(PROJECTS_FILE) or []
-                project_still_available = any(
-                    p['name'] == project_choice and 
-                    p.get('status') == 'Not Selected' and
-                    not p.get('deleted', False)
-                    for p in projects_data
-                )
-                
-                # Check if project already selected by another group
-                groups_data = load_data(GROUPS_FILE) or []
-                project_already_selected = any(
-                    g['project_name'] == project_choice and not g.get('deleted', False)
-                    for g in groups_data
-                )
-                
-                if not project_still_available or project_already_selected:
-                    errors.append("❌ This project is no longer available. Please select another project.")
+            # available_projects was rebuilt from the current groups and projects files at the top of this run
+            chosen_project = find_project(projects_data, project_choice) if project_choice else None
+            if project_choice and (project_choice not in available_projects or chosen_project is None):
+                errors.append("❌ This project is no longer available. Please select another project.")
             
             # Check minimum members (at least member 1)
-            active_members = len([m for m in members_data if m['name'].strip() and m['roll_no'].strip()])
+            active_members = sum(1 for m in members_data if m['name'].strip() and m['roll_no'].strip())
             if active_members < 1:
                 errors.append("❌ At least one member (Group Leader) is required")
             
@@ -2374,9 +3064,8 @@ def display_submission_form(form_content, config):
                 for error in errors:
                     st.markdown(f'<div class="error-card">{error}</div>', unsafe_allow_html=True)
             else:
-                # Load existing groups and config
-                groups = load_data(GROUPS_FILE) or []
-                config = load_data(CONFIG_FILE)
+                # One clock read for the group, its project and the confirmation
+                now = datetime.now()
                 
                 # Create new group with status 'Submitted'
                 new_group = {
@@ -2384,31 +3073,30 @@ def display_submission_form(form_content, config):
                     "project_name": project_choice if project_choice else "",  # empty if no project selected
                     "status": "Submitted",
                     "members": members_data,
-                    "submission_date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "submission_timestamp": datetime.now().isoformat(),
+                    "leader_name": member1_name,
+                    "member_count": count_members(members_data),
+                    "submission_date": now.strftime("%Y-%m-%d %H:%M:%S"),
+                    "submission_timestamp": now.isoformat(),
                     "deleted": False
                 }
                 
                 # Add to groups
-                groups.append(new_group)
-                save_data(groups, GROUPS_FILE)
-                
-                # Update project status only if a project was selected
-                if project_choice:
-                    projects_data = load_data(PROJECTS_FILE) or []
-                    for project in projects_data:
-                        if project['name'] == project_choice:
-                            project['selected_by'] = project.get('selected_by', 0) + 1
-                            # AUTOMATICALLY UPDATE PROJECT STATUS TO 'Submitted'
-                            project['status'] = 'Submitted'
-                            project['selected_by_group'] = new_group['group_number']
-                            project['selected_at'] = datetime.now().isoformat()
-                            break
-                    save_data(projects_data, PROJECTS_FILE)
+                append_record(new_group, GROUPS_FILE)
                 
-                # Update config for next group number
-                config['next_group_number'] = config.get('next_group_number', 1) + 1
-                save_data(config, CONFIG_FILE)
+                # Project and config are written together, sharing one directory fsync
+                with batched_saves() as batch:
+                    # Update project status only if a project was selected
+                    if chosen_project is not None:
+                        chosen_project['selected_by'] = chosen_project.get('selected_by', 0) + 1
+                        # AUTOMATICALLY UPDATE PROJECT STATUS TO 'Submitted'
+                        chosen_project['status'] = 'Submitted'
+                        chosen_project['selected_by_group'] = new_group['group_number']
+                        chosen_project['selected_at'] = now.isoformat()
+                        batch.stage(projects_data, PROJECTS_FILE)
+                    
+                    # Update config for next group number
+                    config['next_group_number'] = config.get('next_group_number', 1) + 1
+                    batch.patch(CONFIG_FILE, {'next_group_number': config['next_group_number']}, pretty=True)
                 
                 # Show success message with animation
                 st.markdown("""
@@ -2450,7 +3138,7 @@ def display_submission_form(form_content, config):
                             </div>
                             <div>
                                 <div style="font-size: 0.9rem; color: #a7f3d0;">Submission Time</div>
-                                <div style="font-weight: 600;">{datetime.now().strftime("%Y-%m-%d %I:%M %p")}</div>
+                                <div style="font-weight: 600;">{now.strftime("%Y-%m-%d %I:%M %p")}</div>
                             </div>
                         </div>
                     </div>
@@ -2510,9 +3198,12 @@ def display_submission_form(form_content, config):
 
 def manage_short_urls():
     """Manage short URLs for the form - MAIN CONTENT AREA"""
+    import pandas as pd
+    
     st.markdown('<h2 class="sub-header">🔗 Short URL Management</h2>', unsafe_allow_html=True)
     
-    # Load short URLs
+    # Load short URLs, writing out buffered clicks first so the counts are current
+    flush_short_url_clicks()
     short_urls = load_data(SHORT_URLS_FILE) or {}
     
     # Get base URL
@@ -2534,13 +3225,13 @@ def manage_short_urls():
             if st.button("🔄 **Generate New Short URL**", use_container_width=True, type="primary"):
                 short_code = generate_short_code()
                 full_url = f"{base_url}/?short={short_code}"
-                short_urls[short_code] = {
+                new_url = {
                     "url": full_url,
                     "created_at": datetime.now().isoformat(),
                     "clicks": 0,
                     "last_accessed": None
                 }
-                if save_data(short_urls, SHORT_URLS_FILE):
+                if patch_data(SHORT_URLS_FILE, {short_code: new_url}):
                     st.success(f"✅ New short URL created!")
                     st.rerun()
     
@@ -2550,22 +3241,24 @@ def manage_short_urls():
     if short_urls:
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📋 Existing Short URLs</h3>', unsafe_allow_html=True)
         
-        url_data = []
-        for code, data in short_urls.items():
-            short_url = f"{base_url}/?short={code}"
-            created_time = datetime.fromisoformat(data['created_at']).strftime("%Y-%m-%d %H:%M") if data.get('created_at') else "Unknown"
-            last_accessed = datetime.fromisoformat(data['last_accessed']).strftime("%Y-%m-%d %H:%M") if data.get('last_accessed') else "Never"
-            
-            url_data.append({
-                "Short Code": code,
-                "Short URL": short_url,
-                "Target URL": data.get('url', ''),
-                "Clicks": data.get('clicks', 0),
-                "Created": created_time,
-                "Last Accessed": last_accessed
-            })
-        
-        df_urls = pd.DataFrame(url_data)
+        # Build the table column-wise straight from the {code: record} mapping
+        urls = pd.DataFrame(list(short_urls.values()), index=list(short_urls.keys())).reindex(
+            columns=['url', 'clicks', 'created_at', 'last_accessed']
+        )
+        codes = urls.index.to_series()
+        
+        def format_times(values, missing):
+            parsed = pd.to_datetime(values.replace('', None), errors='coerce', format='ISO8601')
+            return parsed.dt.strftime("%Y-%m-%d %H:%M").fillna(missing)
+        
+        df_urls = pd.DataFrame({
+            "Short Code": codes,
+            "Short URL": base_url + "/?short=" + codes,
+            "Target URL": urls['url'].fillna(''),
+            "Clicks": pd.to_numeric(urls['clicks']).fillna(0).astype(int),
+            "Created": format_times(urls['created_at'], "Unknown"),
+            "Last Accessed": format_times(urls['last_accessed'], "Never")
+        }).reset_index(drop=True)
         st.dataframe(df_urls, use_container_width=True)
         st.markdown('</div>', unsafe_allow_html=True)
         
@@ -2577,7 +3270,7 @@ def manage_short_urls():
         with col1:
             selected_code = st.selectbox(
                 "**Select URL to manage**",
-                options=[""] + list(short_urls.keys())
+                options=("", *short_urls)
             )
         
         with col2:
@@ -2597,8 +3290,13 @@ def manage_short_urls():
         
         # Copy all URLs
         if st.button("📋 **Copy All URLs to Clipboard**", use_container_width=True, type="primary"):
-            all_urls = "\n".join([f"{base_url}/?short={code}" for code in short_urls.keys()])
-            st.code(all_urls, language="text")
+            # Reuse the joined list until the base URL or the set of codes changes
+            version = (base_url, tuple(short_urls))
+            cached = st.session_state.get('all_short_urls')
+            if cached is None or cached['version'] != version:
+                cached = {"version": version, "text": "\n".join([f"{base_url}/?short={code}" for code in short_urls])}
+                st.session_state.all_short_urls = cached
+            st.code(cached['text'], language="text")
         st.markdown('</div>', unsafe_allow_html=True)
     
     else:
@@ -2630,10 +3328,7 @@ def manage_file_submissions():
             st.write("")  # Spacing
             st.write("")  # Spacing
             if st.button("🔍 **Verify Group**", key="verify_admin_group", use_container_width=True, type="primary"):
-                groups = load_data(GROUPS_FILE) or []
-                group_exists = any(g['group_number'] == admin_group_number and not g.get('deleted', False) for g in groups)
-                
-                if group_exists:
+                if admin_group_number in get_group_indices()["by_number"]:
                     st.session_state.admin_group_verified = True
                     st.session_state.admin_upload_group = admin_group_number
                     st.success(f"✅ Group {admin_group_number} verified!")
@@ -2642,16 +3337,11 @@ def manage_file_submissions():
         
         if st.session_state.get('admin_group_verified', False) and st.session_state.get('admin_upload_group') == admin_group_number:
             # Get group details
-            groups = load_data(GROUPS_FILE) or []
-            group = next((g for g in groups if g['group_number'] == admin_group_number), None)
+            group = get_group_indices()["by_number"].get(admin_group_number)
             
             if group:
                 project_name = group.get('project_name', 'N/A')
-                leader_name = ""
-                for member in group.get('members', []):
-                    if member.get('is_leader'):
-                        leader_name = member.get('name', '')
-                        break
+                leader_name = get_group_leader(group)
                 
                 st.markdown(f"""
                 <div style="background-color: #0c4a6e; padding: 1rem; border-radius: 8px; margin: 1rem 0;">
@@ -2669,23 +3359,16 @@ def manage_file_submissions():
                 """, unsafe_allow_html=True)
                 
                 # File upload
-                file_settings = load_data(FILE_SUBMISSION_FILE) or {}
-                allowed_formats = file_settings.get("allowed_formats", [".pdf", ".doc", ".docx"])
-                max_size_mb = file_settings.get("max_size_mb", 10)
-                max_files = file_settings.get("max_files", 5)
-                
-                file_types = []
-                for fmt in allowed_formats:
-                    if fmt.startswith('.'):
-                        file_types.append(fmt[1:])
-                    else:
-                        file_types.append(fmt)
+                upload_settings = get_file_upload_settings()
+                max_size_mb = upload_settings["max_size_mb"]
+                max_files = upload_settings["max_files"]
+                file_types, formats_text = upload_settings["file_types"], upload_settings["formats_text"]
                 
                 admin_uploaded_files = st.file_uploader(
                     f"**Upload files for Group {admin_group_number}**",
                     type=file_types,
                     accept_multiple_files=True,
-                    help=f"📁 Allowed formats: {', '.join(allowed_formats)} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB each",
+                    help=f"📁 Allowed formats: {formats_text} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB each",
                     key="admin_file_uploader"
                 )
                 
@@ -2714,11 +3397,10 @@ def manage_file_submissions():
                                 
                                 # Save file to disk
                                 file_dir = os.path.join(DATA_DIR, "submitted_files", str(admin_group_number))
-                                Path(file_dir).mkdir(parents=True, exist_ok=True)
+                                ensure_dir(file_dir)
                                 file_path = os.path.join(file_dir, uploaded_file.name)
                                 try:
-                                    with open(file_path, 'wb') as f:
-                                        f.write(uploaded_file.getbuffer())
+                                    save_uploaded_file(uploaded_file, file_path)
                                 except Exception as e:
                                     st.error(f"Error saving file {uploaded_file.name}: {e}")
                                     continue
@@ -2749,49 +3431,9 @@ def manage_file_submissions():
     # Display all groups with submitted files
     st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📋 Submission Status Report</h3>', unsafe_allow_html=True)
     
-    # Get all groups
-    groups = load_data(GROUPS_FILE) or []
-    active_groups = [g for g in groups if not g.get('deleted', False)]
-    
     # Create submission status report
-    status_data = []
-    for group in active_groups:
-        group_num = group['group_number']
-        group_files = file_submissions.get(str(group_num), [])
-        
-        # Get group leader
-        leader_name = ""
-        for member in group['members']:
-            if member.get('is_leader'):
-                leader_name = member['name']
-                break
-        
-        # Get last submission time
-        last_submission = "Not submitted"
-        if group_files:
-            submission_times = [f.get('uploaded_at', '') for f in group_files if f.get('uploaded_at')]
-            if submission_times:
-                try:
-                    last_time = max(submission_times)
-                    last_submission = datetime.fromisoformat(last_time).strftime("%Y-%m-%d %H:%M")
-                except:
-                    last_submission = "Unknown"
-        
-        status_data.append({
-            "Group #": group_num,
-            "Project": group['project_name'] if group['project_name'] else "No project selected",
-            "Group Leader": leader_name,
-            "Files Submitted": len(group_files),
-            "Status": "✅ Submitted" if len(group_files) > 0 else "❌ Not Submitted",
-            "Last Submission": last_submission,
-            "Multiple Submissions": "Yes" if len([f for f in group_files if f.get('submission_count', 0) > 1]) > 0 else "No"
-        })
-    
-    # Sort by group number
-    status_data.sort(key=lambda x: x['Group #'])
-    
-    # Create DataFrame
-    df_status = pd.DataFrame(status_data)
+    df_status = get_file_submission_status()
+    file_counts = df_status["Files Submitted"]
     
     # Display status table
     st.dataframe(
@@ -2814,11 +3456,11 @@ def manage_file_submissions():
     col1, col2, col3, col4 = st.columns(4)
     
     with col1:
-        total_groups = len(active_groups)
+        total_groups = len(df_status)
         st.metric("Total Groups", total_groups, delta=None, delta_color="normal")
     
     with col2:
-        submitted_groups = len([g for g in status_data if g['Files Submitted'] > 0])
+        submitted_groups = int(file_counts.gt(0).sum())
         st.metric("Submitted Groups", submitted_groups, delta=None, delta_color="normal")
     
     with col3:
@@ -2831,18 +3473,18 @@ def manage_file_submissions():
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Show groups without submission
-    not_submitted_groups = [g for g in status_data if g['Files Submitted'] == 0]
+    not_submitted_groups = list(df_status.loc[file_counts.eq(0), ["Group #", "Project", "Group Leader"]].itertuples(index=False))
     if not_submitted_groups:
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📝 Groups Without Submission</h3>', unsafe_allow_html=True)
-        for group in not_submitted_groups:
-            st.markdown(f"• **Group {group['Group #']}**: {group['Project']} (Leader: {group['Group Leader']})")
+        for group_num, project_name, leader_name in not_submitted_groups:
+            st.markdown(f"• **Group {group_num}**: {project_name} (Leader: {leader_name})")
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Download functionality
     st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📥 Download Submitted Files</h3>', unsafe_allow_html=True)
     
     # Display groups with files
-    groups_with_files = [g for g in status_data if g['Files Submitted'] > 0]
+    groups_with_files = df_status.loc[file_counts.gt(0), "Group #"].tolist()
     
     if not groups_with_files:
         st.markdown("""
@@ -2861,36 +3503,24 @@ def manage_file_submissions():
             st.markdown('<div class="card">', unsafe_allow_html=True)
             # Download all files button
             if st.button("⬇️ **Download All Project Files as ZIP**", use_container_width=True, type="primary"):
-                # Check if there are any files
-                has_files = False
-                for group_num in file_submissions.keys():
-                    group_dir = os.path.join(DATA_DIR, "submitted_files", group_num)
-                    if os.path.exists(group_dir) and os.listdir(group_dir):
-                        has_files = True
-                        break
+                # Collect every group's files in one pass; an empty list means there is nothing to download
+                all_group_files = [
+                    (file_path, os.path.join(f"Group_{group_num}", filename))
+                    for group_num in file_submissions.keys()
+                    for file_path, filename in list_dir_files(os.path.join(DATA_DIR, "submitted_files", group_num))
+                ]
                 
-                if not has_files:
+                if not all_group_files:
                     st.warning("No files available for download.")
                 else:
                     # Create zip of all files
-                    zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                        for group_num in file_submissions.keys():
-                            group_dir = os.path.join(DATA_DIR, "submitted_files", group_num)
-                            if os.path.exists(group_dir):
-                                for root, dirs, filenames in os.walk(group_dir):
-                                    for filename in filenames:
-                                        file_path = os.path.join(root, filename)
-                                        arcname = os.path.join(f"Group_{group_num}", filename)
-                                        zip_file.write(file_path, arcname)
-                    
-                    zip_buffer.seek(0)
+                    zip_data = build_zip(all_group_files)
                     
                     # Provide download
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     st.download_button(
                         label="📥 **Download All Project Files**",
-                        data=zip_buffer,
+                        data=zip_data,
                         file_name=f"all_project_files_{timestamp}.zip",
                         mime="application/zip",
                         use_container_width=True
@@ -2900,29 +3530,22 @@ def manage_file_submissions():
         with tab2:
             st.markdown('<div class="card">', unsafe_allow_html=True)
             # Download by group
-            group_options = [f"Group {g['Group #']}" for g in groups_with_files]
+            group_options = [f"Group {n}" for n in groups_with_files]
             selected_group = st.selectbox("**Select Group**", options=[""] + group_options)
             
             if selected_group:
                 group_num = selected_group.replace("Group ", "")
                 group_dir = os.path.join(DATA_DIR, "submitted_files", group_num)
                 
-                if os.path.exists(group_dir) and os.listdir(group_dir):
+                group_files = list_dir_files(group_dir)
+                if group_files:
                     # Create zip file for the group
-                    zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                        for root, dirs, filenames in os.walk(group_dir):
-                            for filename in filenames:
-                                file_path = os.path.join(root, filename)
-                                arcname = filename
-                                zip_file.write(file_path, arcname)
-                    
-                    zip_buffer.seek(0)
+                    zip_data = build_zip(group_files)
                     
                     # Provide download
                     st.download_button(
                         label=f"📥 **Download {selected_group} Files**",
-                        data=zip_buffer,
+                        data=zip_data,
                         file_name=f"{selected_group}_files.zip",
                         mime="application/zip",
                         use_container_width=True
@@ -2939,7 +3562,7 @@ def manage_file_submissions():
     with col1:
         group_to_delete = st.selectbox(
             "**Select group to delete files**",
-            options=[""] + [str(g['Group #']) for g in groups_with_files]
+            options=[""] + [str(n) for n in groups_with_files]
         )
     
     with col2:
@@ -2959,7 +3582,7 @@ def manage_file_submissions():
                     group_dir = os.path.join(DATA_DIR, "submitted_files", group_to_delete)
                     if os.path.exists(group_dir):
                         try:
-                            shutil.rmtree(group_dir)
+                            remove_dir(group_dir)
                         except Exception as e:
                             st.error(f"Error deleting files: {e}")
                     
@@ -2988,18 +3611,13 @@ def manage_lab_manual():
         max_size_mb = lab_settings.get("max_size_mb", 5)
         max_files = lab_settings.get("max_files", 1)
         
-        file_types = []
-        for fmt in allowed_formats:
-            if fmt.startswith('.'):
-                file_types.append(fmt[1:])
-            else:
-                file_types.append(fmt)
+        file_types, formats_text = upload_format_spec(tuple(allowed_formats))
         
         admin_lab_files = st.file_uploader(
             f"**Upload Lab Manual Files**",
             type=file_types,
             accept_multiple_files=True,
-            help=f"📁 Allowed formats: {', '.join(allowed_formats)} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB each",
+            help=f"📁 Allowed formats: {formats_text} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB each",
             key="admin_lab_uploader"
         )
         
@@ -3032,14 +3650,14 @@ def manage_lab_manual():
                             
                             # Save files
                             lab_dir = os.path.join(DATA_DIR, "lab_manual")
-                            Path(lab_dir).mkdir(parents=True, exist_ok=True)
+                            ensure_dir(lab_dir)
                             
                             # Sanitize roll number for directory name
                             sanitized_roll_no = sanitize_filename(admin_lab_roll.strip())
                             
                             # Create directory for this submission
                             submission_dir = os.path.join(lab_dir, sanitized_roll_no)
-                            Path(submission_dir).mkdir(parents=True, exist_ok=True)
+                            ensure_dir(submission_dir)
                             
                             for uploaded_file in admin_lab_files:
                                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -3047,8 +3665,7 @@ def manage_lab_manual():
                                 filename = f"{timestamp}_{sanitized_roll_no}_{sanitized_filename}"
                                 file_path = os.path.join(submission_dir, filename)
                                 
-                                with open(file_path, 'wb') as f:
-                                    f.write(uploaded_file.getbuffer())
+                                save_uploaded_file(uploaded_file, file_path)
                                 
                                 submission_record["files"].append({
                                     "filename": filename,
@@ -3075,7 +3692,7 @@ def manage_lab_manual():
         
         if st.button("💾 **Save Subject Name**", use_container_width=True, type="primary"):
             config['lab_subject_name'] = lab_subject_name
-            if save_data(config, CONFIG_FILE):
+            if patch_data(CONFIG_FILE, {'lab_subject_name': lab_subject_name}, pretty=True):
                 st.success("✅ Subject name saved!")
         
         if lab_subject_name:
@@ -3114,21 +3731,8 @@ def manage_lab_manual():
     with tab1:
         # Display all submissions
         if lab_manual:
-            # Convert to DataFrame for better display
-            df_data = []
-            for submission in lab_manual:
-                df_data.append({
-                    "Name": submission.get('name', ''),
-                    "Roll No": submission.get('roll_no', ''),
-                    "Subject": submission.get('subject_name', ''),
-                    "Status": submission.get('status', 'Submitted'),
-                    "Files": len(submission.get('files', [])),
-                    "File Size": f"{sum(f.get('file_size', 0) for f in submission.get('files', [])) / 1024:.1f} KB" if submission.get('files') else "N/A",
-                    "Submitted": datetime.fromisoformat(submission.get('submission_date', '')).strftime('%Y-%m-%d %H:%M'),
-                    "Uploaded By": submission.get('uploaded_by', 'Student')
-                })
-            
-            df = pd.DataFrame(df_data)
+            # Convert to DataFrame for better display, cached until the file changes
+            df = get_lab_manual_table()
             st.dataframe(df, use_container_width=True)
             st.markdown('</div>', unsafe_allow_html=True)
             
@@ -3138,7 +3742,7 @@ def manage_lab_manual():
             with col1:
                 st.metric("Total Submissions", len(lab_manual), delta=None, delta_color="normal")
             with col2:
-                with_files = len([s for s in lab_manual if s.get('files') and len(s['files']) > 0])
+                with_files = sum(1 for s in lab_manual if s.get('files') and len(s['files']) > 0)
                 st.metric("With Files", with_files, delta=None, delta_color="normal")
             with col3:
                 total_files = sum(len(s.get('files', [])) for s in lab_manual)
@@ -3164,8 +3768,7 @@ def manage_lab_manual():
         else:
             if st.button("📦 **Download All Lab Manuals as ZIP**", use_container_width=True, type="primary"):
                 # Create zip of all files
-                zip_buffer = io.BytesIO()
-                with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                def lab_manual_files():
                     lab_dir = os.path.join(DATA_DIR, "lab_manual")
                     if os.path.exists(lab_dir):
                         for submission in submissions_with_files:
@@ -3179,16 +3782,15 @@ def manage_lab_manual():
                                         file_path = os.path.join(submission_dir, filename)
                                         if os.path.exists(file_path):
                                             # Create a descriptive name for the file
-                                            new_filename = f"{roll_no}_{submission['name']}_{file_info.get('original_filename', filename)}"
-                                            zip_file.write(file_path, new_filename)
+                                            yield file_path, f"{roll_no}_{submission['name']}_{file_info.get('original_filename', filename)}"
                 
-                zip_buffer.seek(0)
+                zip_data = build_zip(lab_manual_files())
                 
                 # Provide download
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 st.download_button(
                     label="⬇️ **Download All Lab Manuals**",
-                    data=zip_buffer,
+                    data=zip_data,
                     file_name=f"lab_manuals_{timestamp}.zip",
                     mime="application/zip",
                     use_container_width=True
@@ -3234,7 +3836,7 @@ def manage_lab_manual():
                         submission_dir = os.path.join(DATA_DIR, "lab_manual", sanitized_roll_no)
                         if os.path.exists(submission_dir):
                             try:
-                                shutil.rmtree(submission_dir)
+                                remove_dir(submission_dir)
                             except Exception as e:
                                 st.error(f"Error deleting files: {e}")
                     
@@ -3244,6 +3846,8 @@ def manage_lab_manual():
 
 def manage_class_assignments():
     """Admin panel to manage class assignment submissions - MAIN CONTENT AREA"""
+    import pandas as pd
+    
     st.markdown('<h2 class="sub-header">📘 Class Assignment Management</h2>', unsafe_allow_html=True)
     
     # Admin upload section in a card
@@ -3267,18 +3871,13 @@ def manage_class_assignments():
         max_size_mb = class_settings.get("max_size_mb", 10)
         max_files = class_settings.get("max_files", 3)
         
-        file_types = []
-        for fmt in allowed_formats:
-            if fmt.startswith('.'):
-                file_types.append(fmt[1:])
-            else:
-                file_types.append(fmt)
+        file_types, formats_text = upload_format_spec(tuple(allowed_formats))
         
         admin_class_files = st.file_uploader(
             f"**Upload Assignment Files**",
             type=file_types,
             accept_multiple_files=True,
-            help=f"📁 Allowed formats: {', '.join(allowed_formats)} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB each",
+            help=f"📁 Allowed formats: {formats_text} | 📦 Maximum files: {max_files} | 💾 Maximum file size: {max_size_mb}MB each",
             key="admin_class_uploader"
         )
         
@@ -3312,14 +3911,14 @@ def manage_class_assignments():
                             
                             # Save files
                             class_dir = os.path.join(DATA_DIR, "class_assignments")
-                            Path(class_dir).mkdir(parents=True, exist_ok=True)
+                            ensure_dir(class_dir)
                             
                             # Sanitize roll number for directory name
                             sanitized_roll_no = sanitize_filename(admin_class_roll.strip())
                             
                             # Create directory for this submission
                             submission_dir = os.path.join(class_dir, f"{sanitized_roll_no}_assignment_{admin_assignment_no}")
-                            Path(submission_dir).mkdir(parents=True, exist_ok=True)
+                            ensure_dir(submission_dir)
                             
                             for uploaded_file in admin_class_files:
                                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -3327,8 +3926,7 @@ def manage_class_assignments():
                                 filename = f"{timestamp}_{sanitized_roll_no}_{admin_assignment_no}_{sanitized_filename}"
                                 file_path = os.path.join(submission_dir, filename)
                                 
-                                with open(file_path, 'wb') as f:
-                                    f.write(uploaded_file.getbuffer())
+                                save_uploaded_file(uploaded_file, file_path)
                                 
                                 submission_record["files"].append({
                                     "filename": filename,
@@ -3361,7 +3959,7 @@ def manage_class_assignments():
         
         if st.button("💾 **Save Assignment Number**", use_container_width=True, type="primary"):
             config['current_assignment_no'] = current_assignment_no
-            if save_data(config, CONFIG_FILE):
+            if patch_data(CONFIG_FILE, {'current_assignment_no': current_assignment_no}, pretty=True):
                 st.success(f"✅ Assignment number set to {current_assignment_no}!")
         
         st.markdown('</div>', unsafe_allow_html=True)
@@ -3373,7 +3971,7 @@ def manage_class_assignments():
         
         if st.button("💾 **Save Course Name**", use_container_width=True, type="primary"):
             config['course_name'] = course_name
-            if save_data(config, CONFIG_FILE):
+            if patch_data(CONFIG_FILE, {'course_name': course_name}, pretty=True):
                 st.success("✅ Course name saved!")
         
         if course_name:
@@ -3412,21 +4010,8 @@ def manage_class_assignments():
     with tab1:
         # Display all submissions
         if class_assignments:
-            # Convert to DataFrame for better display
-            df_data = []
-            for submission in class_assignments:
-                df_data.append({
-                    "Name": submission.get('name', ''),
-                    "Roll No": submission.get('roll_no', ''),
-                    "Course": submission.get('course_name', ''),
-                    "Assignment No": submission.get('assignment_no', 1),
-                    "Files": len(submission.get('files', [])),
-                    "File Size": f"{sum(f.get('file_size', 0) for f in submission.get('files', [])) / 1024:.1f} KB" if submission.get('files') else "N/A",
-                    "Submitted": datetime.fromisoformat(submission.get('submission_date', '')).strftime('%Y-%m-%d %H:%M'),
-                    "Uploaded By": submission.get('uploaded_by', 'Student')
-                })
-            
-            df = pd.DataFrame(df_data)
+            # Convert to DataFrame for better display, cached until the file changes
+            df = get_class_assignments_table()
             st.dataframe(df, use_container_width=True)
             st.markdown('</div>', unsafe_allow_html=True)
             
@@ -3466,8 +4051,7 @@ def manage_class_assignments():
             with col1:
                 if st.button("📦 **Download All as ZIP**", use_container_width=True, type="primary"):
                     # Create zip of all files
-                    zip_buffer = io.BytesIO()
-                    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+                    def class_assignment_files():
                         class_dir = os.path.join(DATA_DIR, "class_assignments")
                         if os.path.exists(class_dir):
                             for submission in submissions_with_files:
@@ -3482,16 +4066,15 @@ def manage_class_assignments():
                                             file_path = os.path.join(submission_dir, filename)
                                             if os.path.exists(file_path):
                                                 # Create a descriptive name for the file
-                                                new_filename = f"Assignment_{assignment_no}_{roll_no}_{submission['name']}_{file_info.get('original_filename', filename)}"
-                                                zip_file.write(file_path, new_filename)
+                                                yield file_path, f"Assignment_{assignment_no}_{roll_no}_{submission['name']}_{file_info.get('original_filename', filename)}"
                     
-                    zip_buffer.seek(0)
+                    zip_data = build_zip(class_assignment_files())
                     
                     # Provide download
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     st.download_button(
                         label="⬇️ **Download ZIP File**",
-                        data=zip_buffer,
+                        data=zip_data,
                         file_name=f"class_assignments_{timestamp}.zip",
                         mime="application/zip",
                         use_container_width=True
@@ -3515,16 +4098,11 @@ def manage_class_assignments():
                         
                         df_export = pd.DataFrame(export_data)
                         
-                        # Create CSV file in memory
-                        csv_buffer = io.StringIO()
-                        df_export.to_csv(csv_buffer, index=False)
-                        csv_buffer.seek(0)
-                        
                         # Provide download
                         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                         st.download_button(
                             label="⬇️ **Download CSV File**",
-                            data=csv_buffer.getvalue(),
+                            data=dataframe_to_csv_bytes(df_export),
                             file_name=f"class_assignments_{timestamp}.csv",
                             mime="text/csv",
                             use_container_width=True
@@ -3574,7 +4152,7 @@ def manage_class_assignments():
                             submission_dir = os.path.join(DATA_DIR, "class_assignments", f"{sanitized_roll_no}_assignment_{assignment_no}")
                             if os.path.exists(submission_dir):
                                 try:
-                                    shutil.rmtree(submission_dir)
+                                    remove_dir(submission_dir)
                                 except Exception as e:
                                     st.error(f"Error deleting files for {selected_roll}: {e}")
                         
@@ -3614,7 +4192,7 @@ def manage_class_assignments():
                             submission_dir = os.path.join(DATA_DIR, "class_assignments", f"{sanitized_roll_no}_assignment_{selected_assignment}")
                             if os.path.exists(submission_dir):
                                 try:
-                                    shutil.rmtree(submission_dir)
+                                    remove_dir(submission_dir)
                                 except Exception as e:
                                     st.error(f"Error deleting files for {roll_no}: {e}")
                         
@@ -3645,8 +4223,8 @@ def manage_class_assignments():
                     class_dir = os.path.join(DATA_DIR, "class_assignments")
                     if os.path.exists(class_dir):
                         try:
-                            shutil.rmtree(class_dir)
-                            Path(class_dir).mkdir(parents=True, exist_ok=True)
+                            remove_dir(class_dir)
+                            ensure_dir(class_dir)
                         except Exception as e:
                             st.error(f"Error deleting files: {e}")
                     
@@ -3901,7 +4479,7 @@ def manage_form_settings():
         # Save mode configuration
         if st.button("💾 **Save Mode Configuration**", key="save_mode", use_container_width=True, type="primary"):
             config["form_mode"] = form_mode
-            if save_data(config, CONFIG_FILE):
+            if patch_data(CONFIG_FILE, {"form_mode": form_mode}, pretty=True):
                 st.success(f"✅ Mode set to: {form_mode.replace('_', ' ').title()}")
         
         st.markdown('</div>', unsafe_allow_html=True)
@@ -3964,7 +4542,7 @@ def manage_form_settings():
         # Save tab visibility
         if st.button("💾 **Save Tab Visibility Settings**", key="save_tab_visibility", use_container_width=True, type="primary"):
             config["tab_visibility"] = visibility
-            if save_data(config, CONFIG_FILE):
+            if patch_data(CONFIG_FILE, {"tab_visibility": visibility}, pretty=True):
                 st.success("✅ Tab visibility settings saved!")
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -4018,7 +4596,7 @@ def manage_form_settings():
                             "datetime": deadline_datetime.isoformat(),
                             "message": custom_message
                         }
-                        if save_data(deadlines, DEADLINES_FILE):
+                        if patch_data(DEADLINES_FILE, {form_type: deadlines[form_type]}):
                             st.success(f"✅ {form_name} deadline saved!")
             
             elif not enabled and form_deadline.get("enabled", False):
@@ -4027,7 +4605,7 @@ def manage_form_settings():
                 with col2:
                     if st.button(f"🗑️ **Remove {form_name} Deadline**", key=f"remove_{form_type}", use_container_width=True, type="secondary"):
                         deadlines[form_type] = {"enabled": False, "datetime": "", "message": ""}
-                        if save_data(deadlines, DEADLINES_FILE):
+                        if patch_data(DEADLINES_FILE, {form_type: deadlines[form_type]}):
                             st.success(f"✅ {form_name} deadline removed!")
     st.markdown('</div>', unsafe_allow_html=True)
     
@@ -4047,7 +4625,7 @@ def manage_form_settings():
         with col2:
             if st.button("💾 **Save Publication Status**", use_container_width=True, type="primary"):
                 config['form_published'] = form_published
-                if save_data(config, CONFIG_FILE):
+                if patch_data(CONFIG_FILE, {'form_published': form_published}, pretty=True):
                     status = "published" if form_published else "unpublished"
                     st.success(f"✅ Form {status} successfully!")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -4100,7 +4678,7 @@ def manage_form_settings():
                 "last_updated": datetime.now().isoformat()
             }
             
-            if save_data(form_content, FORM_CONTENT_FILE):
+            if save_data(form_content, FORM_CONTENT_FILE, pretty=True):
                 st.success("✅ Cover page settings saved successfully!")
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -4155,7 +4733,7 @@ def manage_form_settings():
                 "last_updated": datetime.now().isoformat()
             }
             
-            if save_data(form_content, FORM_CONTENT_FILE):
+            if save_data(form_content, FORM_CONTENT_FILE, pretty=True):
                 st.success("✅ Form header saved successfully!")
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -4278,7 +4856,7 @@ def manage_form_settings():
                 },
                 "last_updated": datetime.now().isoformat()
             }
-            if save_data(form_content, FORM_CONTENT_FILE):
+            if save_data(form_content, FORM_CONTENT_FILE, pretty=True):
                 st.success("✅ Instructions saved!")
         st.markdown('</div>', unsafe_allow_html=True)
     
@@ -4288,6 +4866,7 @@ def manage_form_settings():
     with st.container():
         if st.button("🔄 **Reset to Default Content**", type="secondary", use_container_width=True):
             # Reload default form content
+            init_files.clear()
             init_files()
             st.success("✅ Form content reset to defaults!")
             st.rerun()
@@ -4310,7 +4889,7 @@ def manage_project_section():
                 projects = load_data(PROJECTS_FILE) or []
                 
                 # Check if project already exists (including deleted ones)
-                existing_project = next((p for p in projects if p['name'] == new_project_name), None)
+                existing_project = find_project(projects, new_project_name)
                 
                 if existing_project:
                     if existing_project.get('deleted', False):
@@ -4340,9 +4919,18 @@ def manage_project_section():
     # Display and manage projects
     st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">Project List</h3>', unsafe_allow_html=True)
     projects = load_data(PROJECTS_FILE) or []
-    active_projects = [p for p in projects if not p.get('deleted', False)]
+    active_projects = active_records(projects)
+    projects_by_name = {p['name']: p for p in projects}
+    # Selectbox options with the blank choice first, built once per render
+    project_select_options = ("", *(p['name'] for p in active_projects))
     
     if active_projects:
+        # Index active groups by project once for the whole project list
+        groups_by_project = defaultdict(list)
+        for g in load_data(GROUPS_FILE) or []:
+            if not g.get('deleted', False):
+                groups_by_project[g['project_name']].append(g)
+        
         # Display each project with edit and delete options
         for i, project in enumerate(active_projects):
             with st.container():
@@ -4368,14 +4956,13 @@ def manage_project_section():
                 
                 with col3:
                     # Count groups that have selected this project
-                    groups = load_data(GROUPS_FILE) or []
-                    selected_by = len([g for g in groups if g['project_name'] == project['name'] and not g.get('deleted', False)])
+                    project_groups = groups_by_project.get(project['name'], [])
+                    selected_by = len(project_groups)
                     st.markdown(f"{selected_by} group(s)")
                 
                 with col4:
                     # Show group numbers
-                    groups = load_data(GROUPS_FILE) or []
-                    group_nums = [str(g['group_number']) for g in groups if g['project_name'] == project['name'] and not g.get('deleted', False)]
+                    group_nums = [str(g['group_number']) for g in project_groups]
                     st.markdown(", ".join(group_nums) if group_nums else "None")
                 
                 with col5:
@@ -4398,16 +4985,12 @@ def manage_project_section():
                                 </div>
                                 """, unsafe_allow_html=True)
                             else:
-                                # Mark project as deleted
-                                for j, p in enumerate(projects):
-                                    if p['name'] == project['name']:
-                                        # Add to deleted items for visibility
-                                        add_to_deleted_items("project", p, "Admin deleted from project management")
-                                        
-                                        projects[j]['deleted'] = True
-                                        projects[j]['deleted_at'] = datetime.now().isoformat()
-                                        projects[j]['deleted_reason'] = "Admin deleted from project management"
-                                        break
+                                # Mark project as deleted; active_projects holds the same dicts as projects
+                                add_to_deleted_items("project", project, "Admin deleted from project management")
+                                
+                                project['deleted'] = True
+                                project['deleted_at'] = datetime.now().isoformat()
+                                project['deleted_reason'] = "Admin deleted from project management"
                                 
                                 if save_data(projects, PROJECTS_FILE):
                                     st.success(f"✅ Project '{project['name']}' deleted successfully!")
@@ -4456,25 +5039,27 @@ def manage_project_section():
                                     else:
                                         old_name = project['name']
                                         new_name = new_project_name.strip()
+                                        updated_at = datetime.now().isoformat()
                                         
-                                        # Update project in projects list
-                                        for j, p in enumerate(projects_data):
-                                            if p['name'] == old_name:
-                                                projects_data[j]['name'] = new_name
-                                                projects_data[j]['status'] = new_status
-                                                projects_data[j]['updated_at'] = datetime.now().isoformat()
-                                                break
-                                        
-                                        # If project name changed, update all groups that have this project
-                                        if old_name != new_name:
-                                            groups_data = load_data(GROUPS_FILE) or []
-                                            for group in groups_data:
-                                                if group['project_name'] == old_name:
-                                                    group['project_name'] = new_name
-                                                    group['updated_at'] = datetime.now().isoformat()
-                                            save_data(groups_data, GROUPS_FILE)
+                                        with batched_saves() as batch:
+                                            # Update project in projects list
+                                            for j, p in enumerate(projects_data):
+                                                if p['name'] == old_name:
+                                                    projects_data[j]['name'] = new_name
+                                                    projects_data[j]['status'] = new_status
+                                                    projects_data[j]['updated_at'] = updated_at
+                                                    break
+                                            batch.stage(projects_data, PROJECTS_FILE)
+                                            
+                                            # If project name changed, update all groups that have this project
+                                            if old_name != new_name:
+                                                groups_data = load_data(GROUPS_FILE) or []
+                                                for group in groups_data:
+                                                    if group['project_name'] == old_name:
+                                                        group['project_name'] = new_name
+                                                        group['updated_at'] = updated_at
+                                                batch.stage(groups_data, GROUPS_FILE)
                                         
-                                        save_data(projects_data, PROJECTS_FILE)
                                         st.success("✅ Project updated successfully!")
                                         st.rerun()
                         
@@ -4493,7 +5078,7 @@ def manage_project_section():
         with col1:
             project_to_manage = st.selectbox(
                 "**Select Project to Update Status**",
-                options=[""] + [p['name'] for p in active_projects],
+                options=project_select_options,
                 key="manage_project_select"
             )
         
@@ -4509,16 +5094,16 @@ def manage_project_section():
             st.write("")  # Spacing
             if st.button("**Update Status**", key="update_status_btn", use_container_width=True, type="primary"):
                 if project_to_manage:
-                    for project in projects:
-                        if project['name'] == project_to_manage:
-                            old_status = project['status']
-                            project['status'] = new_status
-                            project['updated_at'] = datetime.now().isoformat()
-                            project['updated_by'] = "admin"
-                            if save_data(projects, PROJECTS_FILE):
-                                st.success(f"✅ Status updated from '{old_status}' to '{new_status}' for '{project_to_manage}'!")
-                                st.rerun()
-                            break
+                    # The dict holds the same objects as projects, so the change is saved with the list
+                    project = projects_by_name.get(project_to_manage)
+                    if project is not None:
+                        old_status = project['status']
+                        project['status'] = new_status
+                        project['updated_at'] = datetime.now().isoformat()
+                        project['updated_by'] = "admin"
+                        if save_data(projects, PROJECTS_FILE):
+                            st.success(f"✅ Status updated from '{old_status}' to '{new_status}' for '{project_to_manage}'!")
+                            st.rerun()
                 else:
                     st.error("❌ Please select a project")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -4538,6 +5123,8 @@ def manage_project_section():
 
 def manage_group_editing():
     """Manage group editing and member deletion - MAIN CONTENT AREA"""
+    import pandas as pd
+    
     st.markdown('<h2 class="sub-header">👥 Group Management</h2>', unsafe_allow_html=True)
     
     # Load groups
@@ -4558,7 +5145,7 @@ def manage_group_editing():
         return
     
     # Filter active groups (not deleted)
-    active_groups = [g for g in groups if not g.get('deleted', False)]
+    active_groups = active_records(groups)
     
     if not active_groups:
         st.markdown("""
@@ -4575,39 +5162,22 @@ def manage_group_editing():
     st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">Select Group to Edit</h3>', unsafe_allow_html=True)
     
     # Display groups in a table
-    group_data = []
-    for group in active_groups:
-        # Find group leader
-        leader_name = ""
-        for member in group['members']:
-            if member.get('is_leader'):
-                leader_name = member['name']
-                break
-        
-        group_data.append({
-            "Group #": group['group_number'],
-            "Project": group['project_name'] if group['project_name'] else "No project selected",
-            "Group Leader": leader_name,
-            "Status": group['status'],
-            "Members": len([m for m in group['members'] if m['name'].strip()]),
-            "Submitted": group.get('submission_date', '')
-        })
-    
-    df_groups = pd.DataFrame(group_data)
+    df_groups = get_group_overview()
     st.dataframe(df_groups, use_container_width=True)
     st.markdown('</div>', unsafe_allow_html=True)
     
     # Selection for editing
-    group_numbers = [g['group_number'] for g in active_groups]
+    group_index_by_number = {g['group_number']: i for i, g in enumerate(groups) if not g.get('deleted', False)}
     selected_group_num = st.selectbox(
         "**Choose a group to edit**",
-        options=[""] + group_numbers,
+        options=("", *group_index_by_number),
         key="edit_group_select"
     )
     
     if selected_group_num:
         # Get group details
-        group_to_edit = next((g for g in groups if g['group_number'] == selected_group_num and not g.get('deleted', False)), None)
+        group_index = group_index_by_number.get(selected_group_num)
+        group_to_edit = groups[group_index] if group_index is not None else None
         
         if group_to_edit:
             # Show group details in a card
@@ -4646,7 +5216,7 @@ def manage_group_editing():
                     st.markdown(f"""
                     <div style="background-color: #111827; padding: 1rem; border-radius: 8px; margin-bottom: 1rem;">
                         <div style="font-size: 0.9rem; color: #9ca3af;">Total Members</div>
-                        <div style="font-weight: 600;">{len([m for m in group_to_edit['members'] if m['name'].strip()])}</div>
+                        <div style="font-weight: 600;">{get_member_count(group_to_edit)}</div>
                     </div>
                     """, unsafe_allow_html=True)
                 
@@ -4687,24 +5257,38 @@ def manage_group_editing():
             with st.container():
                 st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin-bottom: 1rem;">Group Members</h3>', unsafe_allow_html=True)
                 
-                for i, member in enumerate(group_to_edit['members'], 1):
-                    col1, col2, col3 = st.columns([3, 2, 1])
-                    with col1:
-                        leader_badge = "👑 " if member.get('is_leader') else ""
-                        st.markdown(f"{leader_badge}**Member {i}:** {member['name']}")
-                    with col2:
-                        st.markdown(f"**Roll:** {member['roll_no']}")
-                    with col3:
-                        # Don't allow deleting group leader
-                        if not member.get('is_leader'):
-                            if st.button(f"🗑️", key=f"delete_member_{selected_group_num}_{i}", use_container_width=True, type="secondary"):
-                                # Remove member from group
-                                group_to_edit['members'].pop(i-1)
-                                if save_data(groups, GROUPS_FILE):
-                                    st.success(f"✅ Member {i} deleted from group {selected_group_num}!")
-                                    st.rerun()
-                        else:
-                            st.markdown("👑 **Leader**")
+                # One editor for all members; rows can only be deleted, additions go through the form below
+                members = group_to_edit['members']
+                members_df = pd.DataFrame({
+                    "Member": [f"Member {i}" for i in range(1, len(members) + 1)],
+                    "Name": [m['name'] for m in members],
+                    "Roll No": [m['roll_no'] for m in members],
+                    "Role": ["👑 Leader" if m.get('is_leader') else "" for m in members]
+                })
+                editor_version = st.session_state.get('members_editor_version', 0)
+                edited_members = st.data_editor(
+                    members_df,
+                    num_rows="delete",
+                    disabled=list(members_df.columns),
+                    hide_index=True,
+                    use_container_width=True,
+                    key=f"members_editor_{selected_group_num}_{editor_version}"
+                )
+                
+                kept_rows = set(edited_members.index)
+                removed_rows = [i for i in range(len(members)) if i not in kept_rows]
+                if removed_rows:
+                    # Don't allow deleting group leader
+                    if any(members[i].get('is_leader') for i in removed_rows):
+                        st.error("❌ The group leader cannot be removed!")
+                    elif st.button(f"🗑️ **Remove {len(removed_rows)} Member(s)**", key=f"delete_members_{selected_group_num}", use_container_width=True, type="secondary"):
+                        # Remove members from group in a single save
+                        group_to_edit['members'] = [m for i, m in enumerate(members) if i in kept_rows]
+                        group_to_edit['member_count'] = count_members(group_to_edit['members'])
+                        if save_data(groups, GROUPS_FILE):
+                            st.session_state.members_editor_version = editor_version + 1
+                            st.success(f"✅ {len(removed_rows)} member(s) deleted from group {selected_group_num}!")
+                            st.rerun()
                 
                 st.markdown('</div>', unsafe_allow_html=True)
             
@@ -4729,6 +5313,7 @@ def manage_group_editing():
                                         "roll_no": new_member_roll.strip(),
                                         "is_leader": False
                                     })
+                                    group_to_edit['member_count'] = count_members(group_to_edit['members'])
                                     if save_data(groups, GROUPS_FILE):
                                         st.success("✅ New member added!")
                                         st.rerun()
@@ -4768,31 +5353,31 @@ def manage_group_editing():
                         # Archive group data
                         archive_data("group", group_to_edit, reason)
                         
-                        # Mark group as deleted
-                        for i, group in enumerate(groups):
-                            if group['group_number'] == selected_group_num:
-                                groups[i]['deleted'] = True
-                                groups[i]['deleted_at'] = datetime.now().isoformat()
-                                groups[i]['deleted_reason'] = reason
-                                break
-                        
-                        # Update project count and release project back to available pool
-                        project_name = group_to_edit['project_name']
-                        if project_name:  # Only if a project was selected
-                            projects = load_data(PROJECTS_FILE) or []
-                            for project in projects:
-                                if project['name'] == project_name:
-                                    if project.get('selected_by', 0) > 0:
-                                        project['selected_by'] -= 1
-                                        if project['selected_by'] == 0:
-                                            # Release project back to available pool
-                                            project['status'] = 'Not Selected'
-                                            project['released_at'] = datetime.now().isoformat()
-                                            project['released_by_group'] = selected_group_num
-                                    break
-                            save_data(projects, PROJECTS_FILE)
+                        deleted_at = datetime.now().isoformat()
+                        with batched_saves() as batch:
+                            # Mark group as deleted
+                            groups[group_index]['deleted'] = True
+                            groups[group_index]['deleted_at'] = deleted_at
+                            groups[group_index]['deleted_reason'] = reason
+                            batch.stage(groups, GROUPS_FILE)
+                            
+                            # Update project count and release project back to available pool
+                            project_name = group_to_edit['project_name']
+                            if project_name:  # Only if a project was selected
+                                projects = load_data(PROJECTS_FILE) or []
+                                for project in projects:
+                                    if project['name'] == project_name:
+                                        if project.get('selected_by', 0) > 0:
+                                            project['selected_by'] -= 1
+                                            if project['selected_by'] == 0:
+                                                # Release project back to available pool
+                                                project['status'] = 'Not Selected'
+                                                project['released_at'] = deleted_at
+                                                project['released_by_group'] = selected_group_num
+                                        break
+                                batch.stage(projects, PROJECTS_FILE)
                         
-                        if save_data(groups, GROUPS_FILE):
+                        if batch.saved:
                             st.success(f"✅ Group {selected_group_num} deleted successfully and project released!")
                             st.rerun()
                 st.markdown('</div>', unsafe_allow_html=True)
@@ -4800,14 +5385,20 @@ def manage_group_editing():
 def view_deleted_items():
     """View archived/deleted items - MAIN CONTENT AREA (REMOVED SOFT DELETED ITEMS TAB)"""
     st.markdown('<h2 class="sub-header">🗂️ View Archived Items</h2>', unsafe_allow_html=True)
+    report_archive_errors()
     
-    # Get all archive files
+    # Get all archive files, newest first; DirEntry caches the stat used for sorting
     try:
-        archive_files = [f for f in os.listdir(ARCHIVE_DIR) if f.endswith('.json')]
+        with os.scandir(ARCHIVE_DIR) as it:
+            archive_entries = sorted(
+                (e for e in it if e.name.endswith(('.json', '.json.gz'))),
+                key=lambda e: e.stat().st_mtime,
+                reverse=True
+            )
     except FileNotFoundError:
-        archive_files = []
+        archive_entries = []
     
-    if not archive_files:
+    if not archive_entries:
         st.markdown("""
         <div class="info-card">
             <div style="display: flex; align-items: center; gap: 20px;">
@@ -4820,18 +5411,14 @@ def view_deleted_items():
         </div>
         """, unsafe_allow_html=True)
     else:
-        # Sort by modification time (newest first)
-        archive_files.sort(key=lambda x: os.path.getmtime(os.path.join(ARCHIVE_DIR, x)), reverse=True)
-        
         # Delete all button in a card
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">Delete Options</h3>', unsafe_allow_html=True)
         if st.button("🗑️ **Delete All Archived Items**", type="secondary", use_container_width=True):
-            for filename in archive_files:
-                filepath = os.path.join(ARCHIVE_DIR, filename)
+            for entry in archive_entries:
                 try:
-                    os.remove(filepath)
+                    os.remove(entry.path)
                 except Exception as e:
-                    st.error(f"Error deleting {filename}: {e}")
+                    st.error(f"Error deleting {entry.name}: {e}")
             
             st.success("✅ All archived items deleted permanently!")
             st.rerun()
@@ -4839,14 +5426,10 @@ def view_deleted_items():
         
         # Display archive files
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">Archived Items</h3>', unsafe_allow_html=True)
-        for filename in archive_files:
-            filepath = os.path.join(ARCHIVE_DIR, filename)
-            try:
-                with open(filepath, 'r') as f:
-                    archive_data_content = json.load(f)
-            except Exception as e:
-                st.error(f"Error loading {filename}: {e}")
-                continue
+        for entry in archive_entries:
+            filename, filepath = entry.name, entry.path
+            # Newer archives are gzipped; older ones are plain JSON
+            is_gzip = filename.endswith('.gz')
             
             with st.expander(f"📄 **{filename}**", expanded=False):
                 with st.container():
@@ -4854,18 +5437,21 @@ def view_deleted_items():
                     col1, col2 = st.columns([3, 1])
                     
                     with col1:
-                        # Display basic info
-                        data_type = archive_data_content.get("data_type", "Unknown")
-                        deleted_at = archive_data_content.get("deleted_at", "")
-                        reason = archive_data_content.get("reason", "")
+                        # Display basic info, taken from the file name so nothing is parsed up front
+                        data_type, deleted_at = parse_archive_filename(filename)
                         
                         st.markdown(f"**Type:** {data_type}")
-                        st.markdown(f"**Deleted At:** {deleted_at[:19] if deleted_at else 'Unknown'}")
-                        if reason:                            st.markdown(f"**Reason:** {reason}")
+                        st.markdown(f"**Deleted At:** {deleted_at if deleted_at else 'Unknown'}")
                         
-                        # Show preview of data
+                        # Show the archived JSON as text, only when asked for; it is never parsed
                         if st.checkbox(f"**Show data for {filename}**", key=f"show_{filename}"):
-                            st.json(archive_data_content, expanded=False)
+                            try:
+                                file_content = _read_bytes(filepath)
+                                archive_text = (gzip.decompress(file_content) if is_gzip else file_content).decode('utf-8')
+                            except Exception as e:
+                                st.error(f"Error loading {filename}: {e}")
+                            else:
+                                st.code(archive_text, language="json")
                     
                     with col2:
                         # Delete button for individual file
@@ -4877,71 +5463,97 @@ def view_deleted_items():
                             except Exception as e:
                                 st.error(f"Error deleting file: {e}")
                         
-                        # Download button
-                        try:
-                            with open(filepath, 'r') as f:
-                                file_content = f.read()
-                            
-                            st.download_button(
-                                label=f"**Download**",
-                                data=file_content,
-                                file_name=filename,
-                                mime="application/json",
-                                key=f"download_{filename}",
-                                use_container_width=True
-                            )
-                        except Exception as e:
-                            st.error(f"Error reading {filename}: {e}")
+                        # Download button; the file is only read when the button is clicked
+                        st.download_button(
+                            label=f"**Download**",
+                            data=functools.partial(_read_bytes, filepath),
+                            file_name=filename,
+                            mime="application/gzip" if is_gzip else "application/json",
+                            key=f"download_{filename}",
+                            use_container_width=True
+                        )
                     st.markdown('</div>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
+@st.cache_resource(show_spinner=False)
+def member_column_names(max_members):
+    """Get the (Member i Name, Member i Roll No) export headers, built once per max_members"""
+    return tuple((f"Member {i} Name", f"Member {i} Roll No") for i in range(1, max_members + 1))
+
+def _allocations_export_frame(groups, max_members, deleted=False):
+    """Build the allocations export table column-wise from a list of groups"""
+    import pandas as pd
+    
+    frame = pd.DataFrame(groups, columns=['group_number', 'project_name', 'status', 'submission_date',
+                                          'deleted_reason', 'deleted_at', 'members'])
+    project_names = frame['project_name']
+    export = pd.DataFrame({
+        "Group Number": frame['group_number'],
+        "Project Name": project_names.where(project_names.notna() & (project_names != ""), "No project selected"),
+        "Project Status": frame['status'],
+        "Submission Date": frame['submission_date'].fillna('')
+    })
+    if deleted:
+        export["Group Number"] = export["Group Number"].astype(str) + " (DELETED)"
+        export["Project Status"] = export["Project Status"].astype(str) + " (DELETED)"
+        export["Deleted Reason"] = frame['deleted_reason'].fillna('')
+        export["Deleted At"] = frame['deleted_at'].fillna('')
+    
+    # One row per member, numbered within its group, then pivoted into Member i columns
+    members = frame['members'].explode().dropna()
+    member_columns = {}
+    if not members.empty:
+        member_df = pd.DataFrame(members.tolist(), index=members.index)
+        slot = member_df.groupby(level=0).cumcount() + 1
+        names = member_df['name']
+        if 'is_leader' in member_df:
+            names = names.where(~member_df['is_leader'].fillna(False).astype(bool), names + " (Group Leader)")
+        member_df = pd.DataFrame({'name': names, 'roll_no': member_df['roll_no'], 'slot': slot.values},
+                                 index=member_df.index)
+        wide = member_df[member_df['slot'] <= max_members].set_index('slot', append=True).unstack('slot')
+        for (field, i), column in wide.items():
+            member_columns[(i, field)] = column
+    for i, (name_col, roll_col) in enumerate(member_column_names(max_members), 1):
+        for field, col_name in (('name', name_col), ('roll_no', roll_col)):
+            column = member_columns.get((i, field))
+            export[col_name] = "" if column is None else column.reindex(export.index).fillna("")
+    return export
+
 def export_data_section():
     """Export data section with Submission Tracking System - CSV format - MAIN CONTENT AREA"""
+    import pandas as pd
+    
     st.markdown('<h2 class="sub-header">📊 Export Data & Submission Tracking System</h2>', unsafe_allow_html=True)
 
-    # Create tabs for different export options
-    tab1, tab2, tab3, tab4, tab5 = st.tabs([
+    # Pick one export section at a time; unlike st.tabs, only the chosen section's body runs
+    export_sections = [
         "📋 **Project Allocations**",
         "📁 **Project File Submission**",
         "📚 **Lab Manual**",
         "📘 **Class Assignment**",
         "📈 **Comprehensive Report**"
-    ])
+    ]
+    export_section = st.radio(
+        "**Export Section**",
+        options=export_sections,
+        horizontal=True,
+        label_visibility="collapsed",
+        key="export_section"
+    )
+
+    if export_section == export_sections[0]:
+        # Each section loads only the files it reads, without copying them
+        groups = read_data(GROUPS_FILE) or []
+        active_groups = active_records(groups)
+        config = read_data(CONFIG_FILE) or {}
 
-    with tab1:
         # Project Allocations Export
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📋 Project Allocations Export</h3>', unsafe_allow_html=True)
 
-        groups = load_data(GROUPS_FILE) or []
-        active_groups = [g for g in groups if not g.get('deleted', False)]
-        config = load_data(CONFIG_FILE) or {}
         max_members = config.get("max_members", 3)
 
         if active_groups:
-            # Prepare data for CSV
-            csv_data = []
-            for group in active_groups:
-                row = {
-                    "Group Number": group['group_number'],
-                    "Project Name": group['project_name'] if group['project_name'] else "No project selected",
-                    "Project Status": group['status'],
-                    "Submission Date": group.get('submission_date', '')
-                }
-                # Add member information
-                for i in range(1, max_members + 1):
-                    if i <= len(group['members']):
-                        member = group['members'][i-1]
-                        member_name = member['name']
-                        if member.get('is_leader'):
-                            member_name += " (Group Leader)"
-                        row[f"Member {i} Name"] = member_name
-                        row[f"Member {i} Roll No"] = member['roll_no']
-                    else:
-                        row[f"Member {i} Name"] = ""
-                        row[f"Member {i} Roll No"] = ""
-                csv_data.append(row)
-
-            df_export = pd.DataFrame(csv_data)
+            df_export = _allocations_export_frame(active_groups, max_members)
 
             st.markdown('<h4 style="color: #e5e7eb; margin-bottom: 1rem;">Data Preview</h4>', unsafe_allow_html=True)
             st.dataframe(df_export, use_container_width=True)
@@ -4956,28 +5568,9 @@ def export_data_section():
             if st.button("📥 **Generate Export File**", key="generate_allocations", use_container_width=True, type="primary"):
                 if include_deleted:
                     deleted_groups = [g for g in groups if g.get('deleted', False)]
-                    for group in deleted_groups:
-                        row = {
-                            "Group Number": f"{group['group_number']} (DELETED)",
-                            "Project Name": group['project_name'] if group['project_name'] else "No project selected",
-                            "Project Status": f"{group['status']} (DELETED)",
-                            "Submission Date": group.get('submission_date', ''),
-                            "Deleted Reason": group.get('deleted_reason', ''),
-                            "Deleted At": group.get('deleted_at', '')
-                        }
-                        for i in range(1, max_members + 1):
-                            if i <= len(group['members']):
-                                member = group['members'][i-1]
-                                member_name = member['name']
-                                if member.get('is_leader'):
-                                    member_name += " (Group Leader)"
-                                row[f"Member {i} Name"] = member_name
-                                row[f"Member {i} Roll No"] = member['roll_no']
-                            else:
-                                row[f"Member {i} Name"] = ""
-                                row[f"Member {i} Roll No"] = ""
-                        csv_data.append(row)
-                    df_export = pd.DataFrame(csv_data)
+                    if deleted_groups:
+                        df_export = pd.concat([df_export, _allocations_export_frame(deleted_groups, max_members, deleted=True)],
+                                              ignore_index=True)
 
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
@@ -4985,7 +5578,13 @@ def export_data_section():
                     filename = f"project_allocations_{timestamp}.xlsx"
                     try:
                         excel_buffer = io.BytesIO()
-                        with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
+                        # xlsxwriter keeps a much lighter cell table than openpyxl's object model
+                        try:
+                            writer = pd.ExcelWriter(excel_buffer, engine='xlsxwriter',
+                                                    engine_kwargs={"options": {"strings_to_urls": False}})
+                        except ImportError:
+                            writer = pd.ExcelWriter(excel_buffer, engine='openpyxl')
+                        with writer:
                             df_export.to_excel(writer, index=False, sheet_name='Project Allocations')
                         excel_buffer.seek(0)
                         st.download_button(
@@ -4998,20 +5597,18 @@ def export_data_section():
                     except ImportError:
                         st.warning("⚠️ Excel export requires 'openpyxl'. Falling back to CSV.")
                         filename = f"project_allocations_{timestamp}.csv"
-                        csv_string = df_export.to_csv(index=False)
                         st.download_button(
                             label="⬇️ **Click to Download CSV File**",
-                            data=csv_string,
+                            data=dataframe_to_csv_bytes(df_export),
                             file_name=filename,
                             mime="text/csv",
                             use_container_width=True
                         )
                 else:
                     filename = f"project_allocations_{timestamp}.csv"
-                    csv_string = df_export.to_csv(index=False)
                     st.download_button(
                         label="⬇️ **Click to Download CSV File**",
-                        data=csv_string,
+                        data=dataframe_to_csv_bytes(df_export),
                         file_name=filename,
                         mime="text/csv",
                         use_container_width=True
@@ -5032,14 +5629,14 @@ def export_data_section():
             """, unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
 
-    with tab2:
+    if export_section == export_sections[1]:
+        groups = read_data(GROUPS_FILE) or []
+        active_groups = active_records(groups)
+        file_submissions = read_data(FILE_SUBMISSIONS_FILE) or {}
+
         # Project File Submission Report
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📁 Project File Submission Report</h3>', unsafe_allow_html=True)
 
-        file_submissions = load_data(FILE_SUBMISSIONS_FILE) or {}
-        groups = load_data(GROUPS_FILE) or []
-        active_groups = [g for g in groups if not g.get('deleted', False)]
-
         if not file_submissions:
             st.markdown("""
             <div class="info-card">
@@ -5057,7 +5654,7 @@ def export_data_section():
             for group in active_groups:
                 group_num = group['group_number']
                 group_files = file_submissions.get(str(group_num), [])
-                leader_name = next((m['name'] for m in group['members'] if m.get('is_leader')), "")
+                leader_name = get_group_leader(group)
                 if group_files:
                     submission_times = [f.get('uploaded_at', '') for f in group_files if f.get('uploaded_at')]
                     first_submission_formatted = "Unknown"
@@ -5104,7 +5701,7 @@ def export_data_section():
             st.markdown('<h4 style="color: #e5e7eb; margin-bottom: 1rem;">📊 Statistics</h4>', unsafe_allow_html=True)
             col1, col2, col3, col4 = st.columns(4)
             total_groups = len(active_groups)
-            submitted_groups = len([g for g in status_data if g['Files Submitted'] > 0])
+            submitted_groups = sum(1 for g in status_data if g['Files Submitted'] > 0)
             not_submitted = total_groups - submitted_groups
             submission_rate = (submitted_groups / total_groups * 100) if total_groups > 0 else 0
             with col1: st.metric("Total Groups", total_groups)
@@ -5124,15 +5721,17 @@ def export_data_section():
 
                 if report_type == "Detailed Report":
                     detailed_data = []
+                    # file_submissions is keyed by the group number as a string
+                    groups_by_number = {str(g['group_number']): g for g in active_groups}
                     for group_num, files in file_submissions.items():
                         if files:
-                            group_info = next((g for g in active_groups if str(g['group_number']) == group_num), None)
+                            group_info = groups_by_number.get(group_num)
                             if group_info:
                                 for file_info in files:
                                     detailed_data.append({
                                         "Group #": group_num,
                                         "Project": group_info['project_name'] if group_info['project_name'] else "No project selected",
-                                        "Group Leader": next((m['name'] for m in group_info['members'] if m.get('is_leader')), ""),
+                                        "Group Leader": get_group_leader(group_info),
                                         "Filename": file_info.get('filename', ''),
                                         "File Size (MB)": f"{file_info.get('size', 0) / (1024*1024):.2f}",
                                         "Uploaded At": datetime.fromisoformat(file_info.get('uploaded_at', '')).strftime("%Y-%m-%d %H:%M") if file_info.get('uploaded_at') else "Unknown",
@@ -5159,10 +5758,9 @@ def export_data_section():
                     )
                 else:
                     filename = filename_base + ".csv"
-                    csv_string = export_df.to_csv(index=False)
                     st.download_button(
                         label="⬇️ **Download CSV Report**",
-                        data=csv_string,
+                        data=dataframe_to_csv_bytes(export_df),
                         file_name=filename,
                         mime="text/csv",
                         use_container_width=True
@@ -5170,12 +5768,12 @@ def export_data_section():
                 st.success(f"✅ Report '{filename}' is ready for download!")
         st.markdown('</div>', unsafe_allow_html=True)
 
-    with tab3:
+    if export_section == export_sections[2]:
+        lab_manual = read_data(LAB_MANUAL_FILE) or []
+
         # Lab Manual Submission Report
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📚 Lab Manual Submission Report</h3>', unsafe_allow_html=True)
 
-        lab_manual = load_data(LAB_MANUAL_FILE) or []
-
         if not lab_manual:
             st.markdown("""
             <div class="info-card">
@@ -5210,7 +5808,7 @@ def export_data_section():
             col1, col2, col3 = st.columns(3)
             with col1: st.metric("Total Submissions", len(lab_manual))
             with col2:
-                with_files = len([s for s in lab_manual if s.get('files') and len(s['files']) > 0])
+                with_files = sum(1 for s in lab_manual if s.get('files') and len(s['files']) > 0)
                 st.metric("With Files", with_files)
             with col3:
                 total_files = sum(len(s.get('files', [])) for s in lab_manual)
@@ -5265,10 +5863,9 @@ def export_data_section():
                     )
                 else:
                     filename = filename_base + ".csv"
-                    csv_string = export_df.to_csv(index=False)
                     st.download_button(
                         label="⬇️ **Download CSV Report**",
-                        data=csv_string,
+                        data=dataframe_to_csv_bytes(export_df),
                         file_name=filename,
                         mime="text/csv",
                         use_container_width=True
@@ -5276,12 +5873,12 @@ def export_data_section():
                 st.success(f"✅ Report '{filename}' is ready for download!")
         st.markdown('</div>', unsafe_allow_html=True)
 
-    with tab4:
+    if export_section == export_sections[3]:
+        class_assignments = read_data(CLASS_ASSIGNMENTS_FILE) or []
+
         # Class Assignment Submission Report
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📘 Class Assignment Submission Report</h3>', unsafe_allow_html=True)
 
-        class_assignments = load_data(CLASS_ASSIGNMENTS_FILE) or []
-
         if not class_assignments:
             st.markdown("""
             <div class="info-card">
@@ -5401,10 +5998,9 @@ def export_data_section():
                     )
                 else:
                     filename = filename_base + ".csv"
-                    csv_string = export_df.to_csv(index=False)
                     st.download_button(
                         label="⬇️ **Download CSV Report**",
-                        data=csv_string,
+                        data=dataframe_to_csv_bytes(export_df),
                         file_name=filename,
                         mime="text/csv",
                         use_container_width=True
@@ -5412,7 +6008,13 @@ def export_data_section():
                 st.success(f"✅ Report '{filename}' is ready for download!")
         st.markdown('</div>', unsafe_allow_html=True)
 
-    with tab5:
+    if export_section == export_sections[4]:
+        groups = read_data(GROUPS_FILE) or []
+        active_groups = active_records(groups)
+        file_submissions = read_data(FILE_SUBMISSIONS_FILE) or {}
+        lab_manual = read_data(LAB_MANUAL_FILE) or []
+        class_assignments = read_data(CLASS_ASSIGNMENTS_FILE) or []
+
         # Comprehensive Report
         st.markdown('<div class="card"><h3 style="color: #e5e7eb; margin: 0 0 1rem 0; padding-bottom: 0.5rem; border-bottom: 2px solid #374151;">📈 Comprehensive Submission Report</h3>', unsafe_allow_html=True)
         st.markdown("""
@@ -5424,17 +6026,11 @@ def export_data_section():
         </div>
         """, unsafe_allow_html=True)
 
-        groups = load_data(GROUPS_FILE) or []
-        active_groups = [g for g in groups if not g.get('deleted', False)]
-        file_submissions = load_data(FILE_SUBMISSIONS_FILE) or {}
-        lab_manual = load_data(LAB_MANUAL_FILE) or []
-        class_assignments = load_data(CLASS_ASSIGNMENTS_FILE) or []
-
         comprehensive_data = []
         for group in active_groups:
             group_num = group['group_number']
             group_files = file_submissions.get(str(group_num), [])
-            leader_name = next((m['name'] for m in group['members'] if m.get('is_leader')), "")
+            leader_name = get_group_leader(group)
             comprehensive_data.append({
                 "Type": "Project Group",
                 "ID": f"Group {group_num}",
@@ -5533,10 +6129,9 @@ def export_data_section():
                     )
                 else:
                     filename = f"comprehensive_submission_report_{timestamp}.csv"
-                    csv_string = df_comprehensive.to_csv(index=False)
                     st.download_button(
                         label="⬇️ **Download Comprehensive CSV Report**",
-                        data=csv_string,
+                        data=dataframe_to_csv_bytes(df_comprehensive),
                         file_name=filename,
                         mime="text/csv",
                         use_container_width=True
@@ -5611,7 +6206,11 @@ def manage_system_config():
         config['max_members'] = max_members
         config['next_group_number'] = int(next_group_num)
         config['base_url'] = base_url.strip()
-        if save_data(config, CONFIG_FILE):
+        if patch_data(CONFIG_FILE, {
+            'max_members': config['max_members'],
+            'next_group_number': config['next_group_number'],
+            'base_url': config['base_url']
+        }, pretty=True):
             st.success("✅ Configuration saved successfully!")
 
 def change_password():
@@ -5630,9 +6229,8 @@ def change_password():
             
             if submit:
                 admin_data = load_data(ADMIN_CREDENTIALS_FILE)
-                current_hash = hash_password(current_password)
                 
-                if admin_data.get("password_hash") != current_hash:
+                if not verify_password(current_password, admin_data.get("password_hash")):
                     st.error("❌ Current password is incorrect!")
                 elif new_password != confirm_password:
                     st.error("❌ New passwords do not match!")
@@ -5640,10 +6238,15 @@ def change_password():
                     st.error("❌ New password must be at least 6 characters long!")
                 else:
                     admin_data["password_hash"] = hash_password(new_password)
-                    if save_data(admin_data, ADMIN_CREDENTIALS_FILE):
+                    if save_data(admin_data, ADMIN_CREDENTIALS_FILE, pretty=True):
                         st.success("✅ Password changed successfully!")
             st.markdown('</div>', unsafe_allow_html=True)
 
+def reset_admin_section():
+    """Point the admin dashboard back at its first section"""
+    st.session_state.admin_current_section = "🔗 Short URLs"
+    st.session_state.selected_admin_function = manage_short_urls
+
 def admin_login_page():
     """Admin login page - MAIN CONTENT AREA - WITH ENTER KEY SUPPORT"""
     st.markdown("""
@@ -5683,8 +6286,7 @@ def admin_login_page():
             if login_button:
                 if authenticate(username, password):
                     st.session_state.logged_in = True
-                    st.session_state.admin_current_section = "🔗 Short URLs"
-                    st.session_state.selected_admin_function = manage_short_urls
+                    reset_admin_section()
                     st.success("✅ Login successful!")
                     st.rerun()
                 else:
@@ -5742,10 +6344,8 @@ def main():
         short_urls = load_data(SHORT_URLS_FILE) or {}
         
         if short_code in short_urls:
-            # Track click
-            short_urls[short_code]['clicks'] = short_urls[short_code].get('clicks', 0) + 1
-            short_urls[short_code]['last_accessed'] = datetime.now().isoformat()
-            save_data(short_urls, SHORT_URLS_FILE)
+            # Track click; buffered and written in batches
+            record_short_url_click(short_code)
             
             # Show student form WITHOUT Admin Dashboard option
             student_form_standalone()
@@ -5815,8 +6415,7 @@ def main():
                 st.session_state.logged_in = False
                 st.session_state.admin_group_verified = False
                 st.session_state.admin_upload_group = None
-                st.session_state.admin_current_section = "🔗 Short URLs"
-                st.session_state.selected_admin_function = manage_short_urls
+                reset_admin_section()
                 st.session_state.current_page = "Student Form"
                 st.rerun()
         